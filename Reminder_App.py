@@ -3,45 +3,80 @@
 Reminder App
 """
 
+import contextlib
+import functools
+import heapq
 import json
 import os
+import queue
 import time
 import threading
 from datetime import datetime, timedelta
 import sys
 import wave
+from collections import deque
+from importlib.util import find_spec
 
 # GUI libraries
 try:
     import tkinter as tk
     from tkinter import ttk, messagebox, filedialog
+    from tkinter import font as tkfont
     from tkcalendar import DateEntry
     GUI_AVAILABLE = True
 except ImportError:
     GUI_AVAILABLE = False
 
-# System tray
-try:
-    import pystray
-    from pystray import MenuItem as item
-    from PIL import Image, ImageDraw
-    TRAY_AVAILABLE = True
-except ImportError:
-    TRAY_AVAILABLE = False
+# Optional features; the heavy modules are only imported on first use
+TRAY_AVAILABLE = find_spec('pystray') is not None and find_spec('PIL') is not None
+AUDIO_AVAILABLE = find_spec('pygame') is not None
+VOICE_AVAILABLE = find_spec('pyaudio') is not None
 
-# Audio
-try:
-    import pygame
-    AUDIO_AVAILABLE = True
-except ImportError:
-    AUDIO_AVAILABLE = False
 
-# Voice recording
+@functools.cache
+def get_pygame():
+    """Import pygame and start its mixer; None (and audio marked unavailable) if it won't load"""
+    global AUDIO_AVAILABLE
+    try:
+        import pygame
+    except ImportError as e:
+        # find_spec only proves the package is there; its SDL libraries can still be broken
+        print(f"Audio error: {e}")
+        AUDIO_AVAILABLE = False
+        return None
+    try:
+        pygame.mixer.init()
+    except pygame.error as e:
+        print(f"Audio error: {e}")
+    return pygame
+
+
+@functools.cache
+def get_pyaudio():
+    """Import pyaudio; None (and voice marked unavailable) if it won't load"""
+    global VOICE_AVAILABLE
+    try:
+        import pyaudio
+    except ImportError as e:
+        # e.g. the PortAudio library is missing
+        print(f"Voice error: {e}")
+        VOICE_AVAILABLE = False
+        return None
+    return pyaudio
+
+# Fast JSON (optional)
 try:
-    import pyaudio
-    VOICE_AVAILABLE = True
+    import orjson
+    
+    def json_dumps(obj):
+        return orjson.dumps(obj)
+    
+    json_loads = orjson.loads
 except ImportError:
-    VOICE_AVAILABLE = False
+    def json_dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode()
+    
+    json_loads = json.loads
 
 # Data files
 DATA_FILE = os.path.join(os.path.expanduser("~"), "reminder_app_data.json")
@@ -50,6 +85,27 @@ VOICE_NOTES_DIR = os.path.join(os.path.expanduser("~"), "reminder_voice_notes")
 
 os.makedirs(VOICE_NOTES_DIR, exist_ok=True)
 
+# Longest single wait of the scheduler timer; re-arming at least once a minute
+# keeps it on time across system sleep and clock changes
+MAX_TIMER_MS = 60 * 1000
+
+# Reminders due further back than this are never fired, whether they were
+# missed while the app was closed or saved with a time already in the past
+MISSED_GRACE_SECONDS = 60
+
+# Delay before pending settings/data changes are written to disk
+SETTINGS_SAVE_DELAY_MS = 2000
+DATA_SAVE_DELAY_MS = 500
+
+# How long an unanswered alert keeps flashing
+ALERT_FLASH_SECONDS = 60
+
+# Voice note format (16-bit mono). Large blocks (~93 ms) give PortAudio enough
+# slack that a busy Tk thread doesn't cause dropped samples
+VOICE_RATE = 44100
+VOICE_CHUNK = 4096
+MAX_RECORDING_SECONDS = 300
+
 # Colors
 COLORS = {
     'primary': '#667eea',
@@ -61,47 +117,87 @@ COLORS = {
     'alarm_blue': '#2563eb'
 }
 
+
+def _format_12hour(hour, minute):
+    """Format a 24-hour time as shown in the reminder list, e.g. 13:05 -> '1:05 PM'"""
+    ampm = "AM" if hour < 12 else "PM"
+    return f"{hour % 12 or 12}:{minute:02d} {ampm}"
+
+
+# Every stored "HH:MM" mapped to its display text, so rows don't re-parse times
+_TIME_DISPLAY = {f"{h:02d}:{m:02d}": _format_12hour(h, m) for h in range(24) for m in range(60)}
+
+
+@contextlib.contextmanager
+def _batched_layout(window):
+    """Keep a window hidden while its widgets are built, then lay it out and show it once"""
+    window.withdraw()
+    try:
+        yield window
+    finally:
+        window.update_idletasks()
+        window.deiconify()
+
+
 class VoiceRecorder:
     """Simple voice recorder"""
     def __init__(self):
         self.recording = False
-        self.frames = []
         self.audio = None
         self.stream = None
         
-        if VOICE_AVAILABLE:
-            try:
-                self.audio = pyaudio.PyAudio()
-            except:
-                pass
+        # Preallocated sample buffer filled by the PortAudio callback
+        self._ring = None
+        self._write_pos = 0
+        self._stop_evt = threading.Event()
+    
+    def _audio_cb(self, in_data, frame_count, time_info, status):
+        """Copy captured samples into the buffer (runs on the PortAudio thread)"""
+        pyaudio = get_pyaudio()
+        end = self._write_pos + len(in_data)
+        if self._stop_evt.is_set() or end > len(self._ring):
+            return (None, pyaudio.paComplete)
+        
+        self._ring[self._write_pos:end] = in_data
+        self._write_pos = end
+        return (None, pyaudio.paContinue)
     
     def start_recording(self):
-        if not VOICE_AVAILABLE or not self.audio:
+        pyaudio = get_pyaudio() if VOICE_AVAILABLE else None
+        if pyaudio is None:
             return False
         
         try:
-            self.recording = True
-            self.frames = []
-            
-            self.stream = self.audio.open(
-                format=pyaudio.paInt16,
-                channels=1,
-                rate=44100,
-                input=True,
-                frames_per_buffer=1024
-            )
+            # PortAudio probes the audio devices, so it is only started for the first recording
+            if self.audio is None:
+                self.audio = pyaudio.PyAudio()
             
-            def record_thread():
-                while self.recording:
-                    try:
-                        data = self.stream.read(1024)
-                        self.frames.append(data)
-                    except:
-                        break
+            # Allocated once and reused; each recording overwrites it from the start
+            if self._ring is None:
+                self._ring = bytearray(VOICE_RATE * 2 * MAX_RECORDING_SECONDS)
+            self._write_pos = 0
+            self._stop_evt.clear()
+            self.recording = True
             
-            threading.Thread(target=record_thread, daemon=True).start()
+            # Open the device on first use only; later recordings just restart the stream
+            if self.stream is None:
+                self.stream = self.audio.open(
+                    format=pyaudio.paInt16,
+                    channels=1,
+                    rate=VOICE_RATE,
+                    input=True,
+                    frames_per_buffer=VOICE_CHUNK,
+                    stream_callback=self._audio_cb,
+                    start=False
+                )
+            # A stream that ended on its own (buffer full) still counts as running,
+            # and start_stream() would then do nothing
+            if not self.stream.is_active():
+                self.stream.stop_stream()
+            self.stream.start_stream()
             return True
-        except Exception as e:
+        except OSError as e:
+            self.recording = False
             print(f"Recording error: {e}")
             return False
     
@@ -111,81 +207,142 @@ class VoiceRecorder:
         
         try:
             self.recording = False
-            time.sleep(0.2)
+            self._stop_evt.set()
             
+            # stop_stream() returns once the callback has finished its last block
             if self.stream:
                 self.stream.stop_stream()
-                self.stream.close()
             
             filepath = os.path.join(VOICE_NOTES_DIR, filename)
             with wave.open(filepath, 'wb') as wf:
                 wf.setnchannels(1)
-                wf.setsampwidth(self.audio.get_sample_size(pyaudio.paInt16))
-                wf.setframerate(44100)
-                wf.writeframes(b''.join(self.frames))
+                wf.setsampwidth(self.audio.get_sample_size(get_pyaudio().paInt16))
+                wf.setframerate(VOICE_RATE)
+                # wave accepts any bytes-like object, so write the view without copying
+                with memoryview(self._ring)[:self._write_pos] as samples:
+                    wf.writeframes(samples)
             
             return filepath
-        except Exception as e:
+        except (OSError, wave.Error) as e:
             print(f"Save error: {e}")
             return False
+    
+    def cancel_recording(self):
+        """Stop recording and discard what was captured"""
+        if not self.recording:
+            return
+        self.recording = False
+        self._stop_evt.set()
+        try:
+            if self.stream:
+                self.stream.stop_stream()
+        except OSError as e:
+            print(f"Recording error: {e}")
+    
+    def close(self):
+        """Release the audio device"""
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        if self.audio:
+            self.audio.terminate()
+            self.audio = None
 
 class ReminderApp:
     def __init__(self):
-        self.reminders = []
+        self.reminders_by_id = {}  # id -> reminder, in the order they were added
+        self._tree_state = {}  # reminder id -> row values last shown in the tree
+        self._refresh_pending = False
+        self._refresh_all = False
+        self._dirty_rows = set()
+        
+        # Alert window, built on first use and reused for every alert
+        self._alert_win = None
+        self._alert_info = None  # (item_id, title, message, custom_voice) while an alert is up
+        self._alert_queue = deque()
+        self._flash_job = None
+        self._flash_until = 0
         self.alarms = []
-        self.snoozed_items = []
+        self.snoozed_items = {}  # snooze id -> pending snoozed alert, removed once fired
         self.running = True
         self.custom_tone_path = None
+        self._custom_tone_valid = False
+        self._preloaded_sound = None
+        self._sound_channel = None
+        self._sound_used = False
         self.pending_voice_note = None
         self.voice_recorder = VoiceRecorder()
+        self.tray_icon = None
+        self._tray_image = None
+        
+        # Scheduler: min-heap of (trigger_epoch, kind, id) and the armed timer
+        self._pending = []
+        self._after_id = None
+        
+        # Unsaved changes waiting for their debounced write
+        self._settings_dirty = False
+        self._data_dirty = False
+        
+        # Background writer fed with (path, snapshot) pairs
+        self._write_q = queue.Queue()
+        threading.Thread(target=self._writer_loop, daemon=True).start()
         
         # Get screen dimensions
         self.screen_width = 1920
         self.screen_height = 1080
         self.fullscreen_mode = True  # User preference
         
-        if AUDIO_AVAILABLE:
-            try:
-                pygame.mixer.init()
-            except:
-                pass
-        
         self.load_data()
         self.load_settings()
         
         if GUI_AVAILABLE:
-            self.start_monitor_thread()
-            if TRAY_AVAILABLE:
-                self.setup_tray_icon()
             self.create_gui()
+            self.start_scheduler()
+            # The mixer and tray backends are slow to import; bring them up once the window is idle
+            self.root.after_idle(self.preload_custom_tone)
+            if TRAY_AVAILABLE:
+                self.root.after_idle(self.setup_tray_icon)
         else:
             sys.exit(1)
     
     def load_settings(self):
         if os.path.exists(SETTINGS_FILE):
             try:
-                with open(SETTINGS_FILE, 'r') as f:
-                    settings = json.load(f)
+                with open(SETTINGS_FILE, 'rb') as f:
+                    settings = json_loads(f.read())
                     self.custom_tone_path = settings.get('custom_tone_path')
                     self.fullscreen_mode = settings.get('fullscreen_mode', True)
-            except:
-                pass
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"Settings load error: {e}")
     
     def save_settings(self):
+        """Mark settings as changed; a burst of changes is written once"""
+        if not self._settings_dirty:
+            self._settings_dirty = True
+            self.root.after(SETTINGS_SAVE_DELAY_MS, self.flush_settings)
+    
+    def flush_settings(self):
+        """Write settings to disk if they changed"""
+        if not self._settings_dirty:
+            return
+        self._settings_dirty = False
+        
         settings = {
             'custom_tone_path': self.custom_tone_path,
             'fullscreen_mode': self.fullscreen_mode
         }
-        with open(SETTINGS_FILE, 'w') as f:
-            json.dump(settings, f, indent=2)
+        self._write_q.put((SETTINGS_FILE, settings))
     
-    def create_tray_icon_image(self):
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def create_tray_icon_image():
+        """Draw the tray icon; the result only depends on COLORS so it is cached"""
+        from PIL import Image, ImageDraw
         width = 64
         height = 64
-        image = Image.new('RGB', (width, height), 'white')
+        image = Image.new('RGBA', (width, height), (0, 0, 0, 0))
         dc = ImageDraw.Draw(image)
-        dc.ellipse([10, 10, 54, 54], fill=COLORS['primary'])
-        dc.ellipse([15, 15, 49, 49], fill='white')
+        dc.ellipse([10, 10, 54, 54], outline=COLORS['primary'], width=5)
         dc.line([32, 32, 32, 20], fill=COLORS['primary'], width=2)
         dc.line([32, 32, 42, 32], fill=COLORS['primary'], width=2)
         dc.ellipse([30, 30, 34, 34], fill=COLORS['primary'])
@@ -195,16 +352,33 @@ class ReminderApp:
         if not TRAY_AVAILABLE:
             return
         
+        if self.tray_icon:
+            return
+        
         try:
-            icon_image = self.create_tray_icon_image()
+            import pystray
+            from pystray import MenuItem as item
+            
+            if self._tray_image is None:
+                self._tray_image = self.create_tray_icon_image()
             menu = pystray.Menu(
-                item('Show', self.show_window, default=True),
-                item('Exit', self.quit_app)
+                item('Show', self._from_tray(self.show_window), default=True),
+                item('Exit', self._from_tray(self.quit_app))
             )
-            self.tray_icon = pystray.Icon("ReminderApp", icon_image, "Reminder App", menu)
-            threading.Thread(target=self.tray_icon.run, daemon=False).start()
-        except:
-            pass
+            self.tray_icon = pystray.Icon("ReminderApp", self._tray_image, "Reminder App", menu)
+            # Daemon so quitting never waits on the tray loop; stop() is thread-safe
+            threading.Thread(target=self.tray_icon.run, daemon=True).start()
+        except Exception as e:
+            # pystray backends raise their own error types
+            print(f"Tray error: {e}")
+    
+    def _from_tray(self, callback):
+        """Wrap a tray menu action so it runs on the Tk thread.
+        
+        Everything else touches the reminders from Tk callbacks only, so this
+        keeps them single-threaded without a lock.
+        """
+        return lambda: self.root.after(0, callback)
     
     def show_window(self, icon=None, item=None):
         if hasattr(self, 'root'):
@@ -217,36 +391,71 @@ class ReminderApp:
     
     def quit_app(self, icon=None, item=None):
         self.running = False
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self.flush_settings()
+        self.flush_data()
+        self._write_q.join()
+        self.voice_recorder.close()
         if self.tray_icon:
             self.tray_icon.stop()
         if hasattr(self, 'root'):
             try:
                 self.root.quit()
-            except:
+            except (tk.TclError, RuntimeError):
                 pass
         sys.exit(0)
     
+    def preload_custom_tone(self):
+        """Decode the custom tone once so alarms don't reload it from disk"""
+        self._preloaded_sound = None
+        self._custom_tone_valid = bool(self.custom_tone_path) and os.path.exists(self.custom_tone_path)
+        pygame = get_pygame() if AUDIO_AVAILABLE and self._custom_tone_valid else None
+        if pygame is not None:
+            try:
+                self._preloaded_sound = pygame.mixer.Sound(self.custom_tone_path)
+            except pygame.error as e:
+                # Formats Sound can't decode still play through mixer.music
+                print(f"Audio preload error: {e}")
+    
     def play_alarm_sound(self, custom_path=None):
-        if not AUDIO_AVAILABLE:
+        pygame = get_pygame() if AUDIO_AVAILABLE else None
+        if pygame is None:
             print('\a')
             return
         
+        self._sound_used = True
         try:
-            sound_path = custom_path or self.custom_tone_path
-            if sound_path and os.path.exists(sound_path):
+            if not custom_path and self._preloaded_sound:
+                self._sound_channel = self._preloaded_sound.play(loops=-1)
+                return
+            
+            # The custom tone was checked when it was set; only voice notes need a stat here
+            if custom_path:
+                sound_path = custom_path if os.path.exists(custom_path) else None
+            else:
+                sound_path = self.custom_tone_path if self._custom_tone_valid else None
+            
+            if sound_path:
                 pygame.mixer.music.load(sound_path)
                 pygame.mixer.music.play(-1)
             else:
                 print('\a')
-        except Exception as e:
+        except pygame.error as e:
             print(f"Audio error: {e}")
             print('\a')
     
     def stop_alarm_sound(self):
-        if AUDIO_AVAILABLE:
+        # Nothing to stop (or import) if no alarm has played yet
+        if self._sound_used:
+            pygame = get_pygame()
             try:
                 pygame.mixer.music.stop()
-            except:
+                if self._sound_channel:
+                    self._sound_channel.stop()
+                    self._sound_channel = None
+            except pygame.error:
                 pass
     
     def create_gui(self):
@@ -254,6 +463,22 @@ class ReminderApp:
         self.root = tk.Tk()
         self.root.title("⏰ Reminder App")
         
+        # Named fonts shared by the dialogs, so reopening them doesn't re-resolve font specs
+        self._fonts = {
+            name: tkfont.Font(self.root, name=f"reminder_{name}", family="Arial", size=size, weight=weight)
+            for name, size, weight in (
+                ('title', 16, 'bold'),
+                ('heading', 14, 'bold'),
+                ('large_bold', 12, 'bold'),
+                ('button', 11, 'bold'),
+                ('status', 11, 'normal'),
+                ('label_bold', 10, 'bold'),
+                ('body', 10, 'normal'),
+                ('small_bold', 9, 'bold'),
+                ('small', 9, 'normal'),
+            )
+        }
+        
         # Get actual screen size
         self.screen_width = self.root.winfo_screenwidth()
         self.screen_height = self.root.winfo_screenheight()
@@ -283,9 +508,12 @@ class ReminderApp:
         ).pack(pady=5)
         
         # Live clock
+        self.clock_var = tk.StringVar()
+        self._clock_day = None
+        self._clock_date_str = ""
         self.clock_label = tk.Label(
             header,
-            text="",
+            textvariable=self.clock_var,
             font=("Arial", 12),
             bg=COLORS['primary'],
             fg='white'
@@ -396,18 +624,26 @@ class ReminderApp:
         list_frame = tk.LabelFrame(tab, text="Your Reminders", padx=10, pady=10, bg='white', font=("Arial", 11, "bold"))
         list_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Scrollable listbox
+        # Scrollable table, one row per reminder (row iid = reminder id)
         scroll = tk.Scrollbar(list_frame)
         scroll.pack(side=tk.RIGHT, fill=tk.Y)
         
-        self.reminders_listbox = tk.Listbox(
-            list_frame, 
-            yscrollcommand=scroll.set, 
-            font=("Courier", 9),
+        self.reminders_tree = ttk.Treeview(
+            list_frame,
+            columns=('priority', 'title', 'when'),
+            show='headings',
+            selectmode='browse',
+            yscrollcommand=scroll.set,
             height=8
         )
-        self.reminders_listbox.pack(fill=tk.BOTH, expand=True)
-        scroll.config(command=self.reminders_listbox.yview)
+        self.reminders_tree.heading('priority', text="")
+        self.reminders_tree.heading('title', text="Title", anchor=tk.W)
+        self.reminders_tree.heading('when', text="Date & Time", anchor=tk.W)
+        self.reminders_tree.column('priority', width=50, stretch=False, anchor=tk.CENTER)
+        self.reminders_tree.column('title', width=300)
+        self.reminders_tree.column('when', width=160, stretch=False)
+        self.reminders_tree.pack(fill=tk.BOTH, expand=True)
+        scroll.config(command=self.reminders_tree.yview)
         
         # Action buttons
         action_frame = tk.Frame(list_frame, bg='white')
@@ -504,6 +740,7 @@ class ReminderApp:
         
         if file_path:
             self.custom_tone_path = file_path
+            self.preload_custom_tone()
             self.save_settings()
             self.tone_label.config(text=f"Current: {os.path.basename(file_path)}")
             messagebox.showinfo("Success", "Custom tone set!")
@@ -515,26 +752,24 @@ class ReminderApp:
     
     def record_voice_note(self):
         """Record voice note for reminder"""
-        if not VOICE_AVAILABLE:
+        if not VOICE_AVAILABLE or get_pyaudio() is None:
             messagebox.showerror("Error", "Voice recording not available!\n\nInstall: pip install pyaudio")
             return
         
+        # Centered size and position in one geometry call, so there is a single layout pass
+        x = (self.root.winfo_screenwidth() - 400) // 2
+        y = (self.root.winfo_screenheight() - 250) // 2
+        
         dialog = tk.Toplevel(self.root)
         dialog.title("🎤 Record Voice Note")
-        dialog.geometry("400x250")
+        dialog.geometry(f"400x250+{x}+{y}")
         dialog.configure(bg='white')
         dialog.transient(self.root)
         dialog.grab_set()
         
-        # Center
-        dialog.update_idletasks()
-        x = (self.root.winfo_screenwidth() - 400) // 2
-        y = (self.root.winfo_screenheight() - 250) // 2
-        dialog.geometry(f"+{x}+{y}")
-        
-        tk.Label(dialog, text="🎤 Voice Note Recorder", font=("Arial", 14, "bold"), bg='white').pack(pady=20)
+        tk.Label(dialog, text="🎤 Voice Note Recorder", font=self._fonts['heading'], bg='white').pack(pady=20)
         
-        status_label = tk.Label(dialog, text="Ready to record...", font=("Arial", 11), bg='white')
+        status_label = tk.Label(dialog, text="Ready to record...", font=self._fonts['status'], bg='white')
         status_label.pack(pady=10)
         
         recording_data = {'active': False, 'filepath': None}
@@ -576,32 +811,21 @@ class ReminderApp:
         save_btn = tk.Button(btn_frame, text="💾 Use This", command=save_and_close, bg=COLORS['info'], fg='white', padx=15, pady=8, state=tk.DISABLED)
         save_btn.pack(side=tk.LEFT, padx=5)
         
-        tk.Button(dialog, text="Cancel", command=dialog.destroy, padx=15, pady=5).pack(pady=10)
+        cancel = functools.partial(self._close_recorder_dialog, dialog)
+        tk.Button(dialog, text="Cancel", command=cancel, padx=15, pady=5).pack(pady=10)
+        dialog.protocol("WM_DELETE_WINDOW", cancel)
     
-    def show_fullscreen_alert(self, title, message, item_id=None, custom_voice=None):
-        """Show alert - FULLSCREEN or LARGE WINDOW based on settings"""
-        
-        self.stop_alarm_sound()
-        
-        alert = tk.Toplevel()
-        
-        if self.fullscreen_mode:
-            # TRUE FULLSCREEN MODE
-            alert.attributes('-fullscreen', True)
-            alert.attributes('-topmost', True)
-            
-            # Set to detected screen size
-            alert.geometry(f"{self.screen_width}x{self.screen_height}+0+0")
-        else:
-            # LARGE CENTERED WINDOW MODE
-            alert.attributes('-topmost', True)
-            alert_width = int(self.screen_width * 0.8)
-            alert_height = int(self.screen_height * 0.8)
-            x = (self.screen_width - alert_width) // 2
-            y = (self.screen_height - alert_height) // 2
-            alert.geometry(f"{alert_width}x{alert_height}+{x}+{y}")
-        
+    def _close_recorder_dialog(self, dialog):
+        """Close a recorder dialog without keeping an unfinished recording"""
+        self.voice_recorder.cancel_recording()
+        dialog.destroy()
+    
+    def _build_alert_window(self):
+        """Build the alert window once; later alerts only update its text"""
+        alert = tk.Toplevel(self.root)
+        alert.withdraw()
         alert.configure(bg=COLORS['alarm_red'])
+        alert.protocol("WM_DELETE_WINDOW", self.close_alert)
         
         # Container
         container = tk.Frame(alert, bg=COLORS['alarm_red'])
@@ -611,13 +835,16 @@ class ReminderApp:
         tk.Label(container, text="🚨", font=("Arial", 120), bg=COLORS['alarm_red'], fg='white').pack(pady=20)
         
         # Title
-        tk.Label(container, text=title, font=("Arial", 36, "bold"), bg=COLORS['alarm_red'], fg='white', wraplength=1000).pack(pady=15)
+        self._alert_title_lbl = tk.Label(container, font=("Arial", 36, "bold"), bg=COLORS['alarm_red'], fg='white', wraplength=1000)
+        self._alert_title_lbl.pack(pady=15)
         
         # Message
-        tk.Label(container, text=message, font=("Arial", 24), bg=COLORS['alarm_red'], fg='white', wraplength=1000).pack(pady=15)
+        self._alert_msg_lbl = tk.Label(container, font=("Arial", 24), bg=COLORS['alarm_red'], fg='white', wraplength=1000)
+        self._alert_msg_lbl.pack(pady=15)
         
         # Time
-        tk.Label(container, text=datetime.now().strftime("%I:%M:%S %p"), font=("Arial", 20), bg=COLORS['alarm_red'], fg='white').pack(pady=10)
+        self._alert_time_lbl = tk.Label(container, font=("Arial", 20), bg=COLORS['alarm_red'], fg='white')
+        self._alert_time_lbl.pack(pady=10)
         
         # Snooze section
         tk.Label(container, text="⏰ Snooze:", font=("Arial", 18, "bold"), bg=COLORS['alarm_red'], fg='white').pack(pady=10)
@@ -625,16 +852,11 @@ class ReminderApp:
         snooze_frame = tk.Frame(container, bg=COLORS['alarm_red'])
         snooze_frame.pack(pady=10)
         
-        def snooze_action(minutes):
-            self.snooze_item(item_id, minutes, title, message, custom_voice)
-            self.stop_alarm_sound()
-            alert.destroy()
-        
         for minutes in [5, 10, 15, 30]:
             tk.Button(
                 snooze_frame,
                 text=f"{minutes} min",
-                command=lambda m=minutes: snooze_action(m),
+                command=lambda m=minutes: self.snooze_alert(m),
                 bg='white',
                 fg=COLORS['alarm_red'],
                 font=("Arial", 16, "bold"),
@@ -646,7 +868,7 @@ class ReminderApp:
         tk.Button(
             container,
             text="✓ DISMISS",
-            command=lambda: [self.stop_alarm_sound(), alert.destroy()],
+            command=self.close_alert,
             bg='white',
             fg=COLORS['alarm_red'],
             font=("Arial", 24, "bold"),
@@ -654,17 +876,53 @@ class ReminderApp:
             pady=15
         ).pack(pady=20)
         
-        # Flash effect
-        def flash(color_index=0):
-            colors = [COLORS['alarm_red'], COLORS['alarm_blue']]
-            try:
-                alert.configure(bg=colors[color_index])
-                container.configure(bg=colors[color_index])
-                alert.after(500, lambda: flash(1 - color_index))
-            except:
-                pass
+        self._alert_win = alert
+        self._alert_container = container
+    
+    def show_fullscreen_alert(self, title, message, item_id=None, custom_voice=None):
+        """Show alert - FULLSCREEN or LARGE WINDOW based on settings"""
+        
+        if self._alert_win is None:
+            self._build_alert_window()
+        elif self._alert_info is not None:
+            # One alert at a time; the next is shown when this one closes.
+            # The open alert may have been minimised, so bring it back into view
+            self._alert_queue.append((title, message, item_id, custom_voice))
+            self._alert_win.deiconify()
+            self._alert_win.lift()
+            return
+        
+        self.stop_alarm_sound()
+        self._alert_info = (item_id, title, message, custom_voice)
+        alert = self._alert_win
+        
+        if self.fullscreen_mode:
+            # TRUE FULLSCREEN MODE
+            alert.attributes('-fullscreen', True)
+            alert.attributes('-topmost', True)
+            
+            # Set to detected screen size
+            alert.geometry(f"{self.screen_width}x{self.screen_height}+0+0")
+        else:
+            # LARGE CENTERED WINDOW MODE
+            alert.attributes('-fullscreen', False)
+            alert.attributes('-topmost', True)
+            alert_width = int(self.screen_width * 0.8)
+            alert_height = int(self.screen_height * 0.8)
+            x = (self.screen_width - alert_width) // 2
+            y = (self.screen_height - alert_height) // 2
+            alert.geometry(f"{alert_width}x{alert_height}+{x}+{y}")
+        
+        self._alert_title_lbl.config(text=title)
+        self._alert_msg_lbl.config(text=message)
+        self._alert_time_lbl.config(text=datetime.now().strftime("%I:%M:%S %p"))
         
-        flash()
+        alert.deiconify()
+        alert.lift()
+        
+        # Flash effect, stopped on close or after ALERT_FLASH_SECONDS
+        self._flash_until = time.time() + ALERT_FLASH_SECONDS
+        self._flash_alert()
         
         # Play sound
         self.play_alarm_sound(custom_voice)
@@ -672,6 +930,38 @@ class ReminderApp:
         if not hasattr(self, 'root') or self.root.state() == 'withdrawn':
             self.show_window()
     
+    def _flash_alert(self, color_index=0):
+        """Alternate the alert background until closed or timed out"""
+        self._flash_job = None
+        if not self._alert_win.winfo_exists():
+            return
+        
+        colors = [COLORS['alarm_red'], COLORS['alarm_blue']]
+        self._alert_win.configure(bg=colors[color_index])
+        self._alert_container.configure(bg=colors[color_index])
+        if time.time() < self._flash_until:
+            self._flash_job = self._alert_win.after(500, self._flash_alert, 1 - color_index)
+    
+    def close_alert(self):
+        """Hide the alert and show the next queued one, if any"""
+        if self._alert_info is None:
+            return
+        if self._flash_job:
+            self._alert_win.after_cancel(self._flash_job)
+            self._flash_job = None
+        self.stop_alarm_sound()
+        self._alert_win.withdraw()
+        self._alert_info = None
+        
+        if self._alert_queue:
+            self.show_fullscreen_alert(*self._alert_queue.popleft())
+    
+    def snooze_alert(self, minutes):
+        """Snooze the alert currently shown"""
+        item_id, title, message, custom_voice = self._alert_info
+        self.snooze_item(item_id, minutes, title, message, custom_voice)
+        self.close_alert()
+    
     def snooze_item(self, item_id, minutes, title, message, custom_voice):
         """Snooze an alert"""
         trigger_time = datetime.now() + timedelta(minutes=minutes)
@@ -682,303 +972,321 @@ class ReminderApp:
             'title': title,
             'message': message,
             'trigger_time': trigger_time.strftime("%Y-%m-%d %H:%M"),
+            'trigger_epoch': int(trigger_time.replace(second=0, microsecond=0).timestamp()),
             'custom_voice': custom_voice,
             'active': True
         }
         
-        self.snoozed_items.append(snoozed)
+        self.snoozed_items[snoozed['id']] = snoozed
+        self.schedule_item(snoozed, 'snooze')
         messagebox.showinfo("Snoozed", f"Will alert again at {trigger_time.strftime('%I:%M %p')}")
     
-    def check_snoozed(self):
-        """Check snoozed items"""
-        now = datetime.now()
-        current = now.strftime("%Y-%m-%d %H:%M")
-        
-        for item in self.snoozed_items:
-            if item['active'] and item['trigger_time'] == current:
-                self.show_fullscreen_alert(item['title'], item['message'], item['original_id'], item.get('custom_voice'))
-                item['active'] = False
-    
     def edit_reminder(self):
         """Edit selected reminder"""
-        selection = self.reminders_listbox.curselection()
+        selection = self.reminders_tree.selection()
         if not selection:
             messagebox.showwarning("Warning", "Select a reminder to edit!")
             return
         
-        item_text = self.reminders_listbox.get(selection[0])
-        try:
-            reminder_id = int(item_text.split("ID:")[1].strip())
-            reminder = next((r for r in self.reminders if r['id'] == reminder_id), None)
-            
-            if reminder:
-                self.show_edit_dialog(reminder)
-        except:
+        reminder = self.reminders_by_id.get(int(selection[0]))
+        if reminder:
+            self.show_edit_dialog(reminder)
+        else:
             messagebox.showerror("Error", "Could not edit")
     
     def show_edit_dialog(self, reminder):
         """Show edit dialog with time and voice recording options"""
+        x = (self.root.winfo_screenwidth() - 550) // 2
+        y = (self.root.winfo_screenheight() - 550) // 2
+        
         dialog = tk.Toplevel(self.root)
         dialog.title("✏️ Edit Reminder")
-        dialog.geometry("550x550")
+        dialog.geometry(f"550x550+{x}+{y}")
         dialog.configure(bg='white')
         dialog.transient(self.root)
-        dialog.grab_set()
-        
-        # Center
-        dialog.update_idletasks()
-        x = (self.root.winfo_screenwidth() - 550) // 2
-        y = (self.root.winfo_screenheight() - 550) // 2
-        dialog.geometry(f"+{x}+{y}")
-        
-        tk.Label(dialog, text="✏️ Edit Reminder", font=("Arial", 16, "bold"), bg='white', fg=COLORS['primary']).pack(pady=15)
-        
-        form = tk.Frame(dialog, bg='white')
-        form.pack(padx=20, pady=10, fill=tk.BOTH, expand=True)
-        
-        row = 0
-        
-        # Title
-        tk.Label(form, text="Title:", bg='white', font=("Arial", 10, "bold")).grid(row=row, column=0, sticky=tk.W, pady=8)
-        title_entry = tk.Entry(form, width=35, font=("Arial", 10))
-        title_entry.insert(0, reminder['title'])
-        title_entry.grid(row=row, column=1, pady=8, sticky=tk.W)
         
-        row += 1
-        
-        # Description
-        tk.Label(form, text="Description:", bg='white', font=("Arial", 10, "bold")).grid(row=row, column=0, sticky=tk.W, pady=8)
-        desc_entry = tk.Entry(form, width=35, font=("Arial", 10))
-        desc_entry.insert(0, reminder['description'])
-        desc_entry.grid(row=row, column=1, pady=8, sticky=tk.W)
-        
-        row += 1
-        
-        # Date
-        tk.Label(form, text="Date:", bg='white', font=("Arial", 10, "bold")).grid(row=row, column=0, sticky=tk.W, pady=8)
-        date_entry = DateEntry(form, width=25, font=("Arial", 10))
-        try:
-            date_entry.set_date(datetime.strptime(reminder['date'], "%Y-%m-%d").date())
-        except:
-            pass
-        date_entry.grid(row=row, column=1, pady=8, sticky=tk.W)
-        
-        row += 1
-        
-        # Time
-        tk.Label(form, text="Time:", bg='white', font=("Arial", 10, "bold")).grid(row=row, column=0, sticky=tk.W, pady=8)
-        
-        # Parse existing time
-        try:
-            h24, m = reminder['time'].split(':')
-            h24 = int(h24)
-            minute = int(m)
-            ampm = "AM" if h24 < 12 else "PM"
-            hour = h24 if h24 <= 12 else h24 - 12
-            if hour == 0:
-                hour = 12
-        except:
-            hour = 12
-            minute = 0
-            ampm = "AM"
-        
-        # Time picker
-        time_frame = tk.Frame(form, bg='white')
-        time_frame.grid(row=row, column=1, pady=8, sticky=tk.W)
-        
-        edit_hour_var = tk.IntVar(value=hour)
-        tk.Spinbox(time_frame, from_=1, to=12, textvariable=edit_hour_var, width=3, font=("Arial", 10)).pack(side=tk.LEFT, padx=2)
-        tk.Label(time_frame, text=":", bg='white', font=("Arial", 12, "bold")).pack(side=tk.LEFT)
-        edit_minute_var = tk.IntVar(value=minute)
-        tk.Spinbox(time_frame, from_=0, to=59, textvariable=edit_minute_var, width=3, font=("Arial", 10), format="%02.0f").pack(side=tk.LEFT, padx=2)
-        
-        edit_ampm_var = tk.StringVar(value=ampm)
-        tk.Radiobutton(time_frame, text="AM", variable=edit_ampm_var, value="AM", bg='white', font=("Arial", 9)).pack(side=tk.LEFT, padx=5)
-        tk.Radiobutton(time_frame, text="PM", variable=edit_ampm_var, value="PM", bg='white', font=("Arial", 9)).pack(side=tk.LEFT, padx=5)
-        
-        row += 1
-        
-        # Priority
-        tk.Label(form, text="Priority:", bg='white', font=("Arial", 10, "bold")).grid(row=row, column=0, sticky=tk.W, pady=8)
-        priority_combo = ttk.Combobox(form, values=["normal", "urgent"], width=23, font=("Arial", 10))
-        priority_combo.set(reminder.get('priority', 'normal'))
-        priority_combo.grid(row=row, column=1, pady=8, sticky=tk.W)
-        
-        row += 1
-        
-        # Current voice note status
-        current_voice = reminder.get('voice_note', '')
-        voice_filename = os.path.basename(current_voice) if current_voice else "None"
-        
-        tk.Label(form, text="Voice Note:", bg='white', font=("Arial", 10, "bold")).grid(row=row, column=0, sticky=tk.W, pady=8)
-        voice_status_label = tk.Label(form, text=f"Current: {voice_filename}", bg='white', fg=COLORS['info'], font=("Arial", 9))
-        voice_status_label.grid(row=row, column=1, pady=8, sticky=tk.W)
-        
-        row += 1
-        
-        # Voice recording for edit
-        new_voice_note = {'path': None}
-        
-        def record_new_voice():
-            """Record new voice note for this reminder"""
-            if not VOICE_AVAILABLE:
-                messagebox.showerror("Error", "Voice recording not available!\n\nInstall: pip install pyaudio")
-                return
+        with _batched_layout(dialog):
+            tk.Label(dialog, text="✏️ Edit Reminder", font=self._fonts['title'], bg='white', fg=COLORS['primary']).pack(pady=15)
             
-            rec_dialog = tk.Toplevel(dialog)
-            rec_dialog.title("🎤 Record New Voice Note")
-            rec_dialog.geometry("400x250")
-            rec_dialog.configure(bg='white')
-            rec_dialog.transient(dialog)
-            rec_dialog.grab_set()
+            form = tk.Frame(dialog, bg='white')
+            form.pack(padx=20, pady=10, fill=tk.BOTH, expand=True)
             
-            # Center
-            rec_dialog.update_idletasks()
-            rx = (dialog.winfo_screenwidth() - 400) // 2
-            ry = (dialog.winfo_screenheight() - 250) // 2
-            rec_dialog.geometry(f"+{rx}+{ry}")
+            row = 0
             
-            tk.Label(rec_dialog, text="🎤 Record Voice Note", font=("Arial", 14, "bold"), bg='white').pack(pady=20)
+            # Title
+            tk.Label(form, text="Title:", bg='white', font=self._fonts['label_bold']).grid(row=row, column=0, sticky=tk.W, pady=8)
+            title_entry = tk.Entry(form, width=35, font=self._fonts['body'])
+            title_entry.insert(0, reminder['title'])
+            title_entry.grid(row=row, column=1, pady=8, sticky=tk.W)
             
-            status_label = tk.Label(rec_dialog, text="Ready to record...", font=("Arial", 11), bg='white')
-            status_label.pack(pady=10)
+            row += 1
             
-            recording_data = {'active': False, 'filepath': None}
+            # Description
+            tk.Label(form, text="Description:", bg='white', font=self._fonts['label_bold']).grid(row=row, column=0, sticky=tk.W, pady=8)
+            desc_entry = tk.Entry(form, width=35, font=self._fonts['body'])
+            desc_entry.insert(0, reminder['description'])
+            desc_entry.grid(row=row, column=1, pady=8, sticky=tk.W)
             
-            def start_rec():
-                if self.voice_recorder.start_recording():
-                    recording_data['active'] = True
-                    status_label.config(text="🔴 Recording... Speak now!", fg='red')
-                    start_btn.config(state=tk.DISABLED)
-                    stop_btn.config(state=tk.NORMAL)
+            row += 1
             
-            def stop_rec():
-                if recording_data['active']:
-                    filename = f"voice_{int(time.time())}.wav"
-                    filepath = self.voice_recorder.stop_recording(filename)
-                    if filepath:
-                        recording_data['filepath'] = filepath
-                        recording_data['active'] = False
-                        status_label.config(text=f"✓ Saved!", fg='green')
-                        stop_btn.config(state=tk.DISABLED)
-                        save_btn.config(state=tk.NORMAL)
+            # Date
+            tk.Label(form, text="Date:", bg='white', font=self._fonts['label_bold']).grid(row=row, column=0, sticky=tk.W, pady=8)
+            date_entry = DateEntry(form, width=25, font=self._fonts['body'])
+            try:
+                date_entry.set_date(datetime.strptime(reminder['date'], "%Y-%m-%d").date())
+            except (KeyError, ValueError):
+                pass
+            date_entry.grid(row=row, column=1, pady=8, sticky=tk.W)
             
-            def save_voice():
-                if recording_data['filepath']:
-                    new_voice_note['path'] = recording_data['filepath']
-                    voice_status_label.config(text=f"New: {os.path.basename(recording_data['filepath'])}")
-                    messagebox.showinfo("Success", "New voice note will replace the old one when you save!")
-                    rec_dialog.destroy()
+            row += 1
             
-            btn_frame = tk.Frame(rec_dialog, bg='white')
-            btn_frame.pack(pady=20)
+            # Time
+            tk.Label(form, text="Time:", bg='white', font=self._fonts['label_bold']).grid(row=row, column=0, sticky=tk.W, pady=8)
             
-            start_btn = tk.Button(btn_frame, text="▶️ Start", command=start_rec, bg=COLORS['success'], fg='white', padx=15, pady=8)
-            start_btn.pack(side=tk.LEFT, padx=5)
+            # Parse existing time
+            try:
+                h24, m = reminder['time'].split(':')
+                h24 = int(h24)
+                minute = int(m)
+                ampm = "AM" if h24 < 12 else "PM"
+                hour = h24 if h24 <= 12 else h24 - 12
+                if hour == 0:
+                    hour = 12
+            except (KeyError, ValueError):
+                hour = 12
+                minute = 0
+                ampm = "AM"
             
-            stop_btn = tk.Button(btn_frame, text="⏹️ Stop", command=stop_rec, bg=COLORS['danger'], fg='white', padx=15, pady=8, state=tk.DISABLED)
-            stop_btn.pack(side=tk.LEFT, padx=5)
+            # Time picker
+            time_frame = tk.Frame(form, bg='white')
+            time_frame.grid(row=row, column=1, pady=8, sticky=tk.W)
             
-            save_btn = tk.Button(btn_frame, text="💾 Use This", command=save_voice, bg=COLORS['info'], fg='white', padx=15, pady=8, state=tk.DISABLED)
-            save_btn.pack(side=tk.LEFT, padx=5)
+            edit_hour_var = tk.IntVar(value=hour)
+            tk.Spinbox(time_frame, from_=1, to=12, textvariable=edit_hour_var, width=3, font=self._fonts['body']).pack(side=tk.LEFT, padx=2)
+            tk.Label(time_frame, text=":", bg='white', font=self._fonts['large_bold']).pack(side=tk.LEFT)
+            edit_minute_var = tk.IntVar(value=minute)
+            tk.Spinbox(time_frame, from_=0, to=59, textvariable=edit_minute_var, width=3, font=self._fonts['body'], format="%02.0f").pack(side=tk.LEFT, padx=2)
             
-            tk.Button(rec_dialog, text="Cancel", command=rec_dialog.destroy, padx=15, pady=5).pack(pady=10)
-        
-        # Record button
-        tk.Button(
-            form,
-            text="🎤 Record New Voice",
-            command=record_new_voice,
-            bg=COLORS['info'],
-            fg='white',
-            font=("Arial", 9, "bold"),
-            padx=10,
-            pady=5
-        ).grid(row=row, column=1, pady=8, sticky=tk.W)
-        
-        row += 1
-        
-        # Option to remove voice note
-        def remove_voice():
-            reminder['voice_note'] = None
-            new_voice_note['path'] = None
-            voice_status_label.config(text="Current: None")
-            messagebox.showinfo("Info", "Voice note will be removed when you save")
-        
-        if current_voice:
+            edit_ampm_var = tk.StringVar(value=ampm)
+            tk.Radiobutton(time_frame, text="AM", variable=edit_ampm_var, value="AM", bg='white', font=self._fonts['small']).pack(side=tk.LEFT, padx=5)
+            tk.Radiobutton(time_frame, text="PM", variable=edit_ampm_var, value="PM", bg='white', font=self._fonts['small']).pack(side=tk.LEFT, padx=5)
+            
+            row += 1
+            
+            # Priority
+            tk.Label(form, text="Priority:", bg='white', font=self._fonts['label_bold']).grid(row=row, column=0, sticky=tk.W, pady=8)
+            priority_combo = ttk.Combobox(form, values=["normal", "urgent"], width=23, font=self._fonts['body'])
+            priority_combo.set(reminder.get('priority', 'normal'))
+            priority_combo.grid(row=row, column=1, pady=8, sticky=tk.W)
+            
+            row += 1
+            
+            # Current voice note status
+            current_voice = reminder.get('voice_note', '')
+            voice_filename = os.path.basename(current_voice) if current_voice else "None"
+            
+            tk.Label(form, text="Voice Note:", bg='white', font=self._fonts['label_bold']).grid(row=row, column=0, sticky=tk.W, pady=8)
+            voice_status_label = tk.Label(form, text=f"Current: {voice_filename}", bg='white', fg=COLORS['info'], font=self._fonts['small'])
+            voice_status_label.grid(row=row, column=1, pady=8, sticky=tk.W)
+            
+            row += 1
+            
+            # Voice recording for edit
+            new_voice_note = {'path': None, 'remove': False}
+            
+            def record_new_voice():
+                """Record new voice note for this reminder"""
+                if not VOICE_AVAILABLE or get_pyaudio() is None:
+                    messagebox.showerror("Error", "Voice recording not available!\n\nInstall: pip install pyaudio")
+                    return
+                
+                # Centered size and position in one geometry call, so there is a single layout pass
+                rx = (dialog.winfo_screenwidth() - 400) // 2
+                ry = (dialog.winfo_screenheight() - 250) // 2
+                
+                rec_dialog = tk.Toplevel(dialog)
+                rec_dialog.title("🎤 Record New Voice Note")
+                rec_dialog.geometry(f"400x250+{rx}+{ry}")
+                rec_dialog.configure(bg='white')
+                rec_dialog.transient(dialog)
+                
+                with _batched_layout(rec_dialog):
+                    tk.Label(rec_dialog, text="🎤 Record Voice Note", font=self._fonts['heading'], bg='white').pack(pady=20)
+                    
+                    status_label = tk.Label(rec_dialog, text="Ready to record...", font=self._fonts['status'], bg='white')
+                    status_label.pack(pady=10)
+                    
+                    recording_data = {'active': False, 'filepath': None}
+                    
+                    def start_rec():
+                        if self.voice_recorder.start_recording():
+                            recording_data['active'] = True
+                            status_label.config(text="🔴 Recording... Speak now!", fg='red')
+                            start_btn.config(state=tk.DISABLED)
+                            stop_btn.config(state=tk.NORMAL)
+                    
+                    def stop_rec():
+                        if recording_data['active']:
+                            filename = f"voice_{int(time.time())}.wav"
+                            filepath = self.voice_recorder.stop_recording(filename)
+                            if filepath:
+                                recording_data['filepath'] = filepath
+                                recording_data['active'] = False
+                                status_label.config(text=f"✓ Saved!", fg='green')
+                                stop_btn.config(state=tk.DISABLED)
+                                save_btn.config(state=tk.NORMAL)
+                    
+                    def save_voice():
+                        if recording_data['filepath']:
+                            new_voice_note['path'] = recording_data['filepath']
+                            new_voice_note['remove'] = False
+                            voice_status_label.config(text=f"New: {os.path.basename(recording_data['filepath'])}")
+                            messagebox.showinfo("Success", "New voice note will replace the old one when you save!")
+                            rec_dialog.destroy()
+                    
+                    btn_frame = tk.Frame(rec_dialog, bg='white')
+                    btn_frame.pack(pady=20)
+                    
+                    start_btn = tk.Button(btn_frame, text="▶️ Start", command=start_rec, bg=COLORS['success'], fg='white', padx=15, pady=8)
+                    start_btn.pack(side=tk.LEFT, padx=5)
+                    
+                    stop_btn = tk.Button(btn_frame, text="⏹️ Stop", command=stop_rec, bg=COLORS['danger'], fg='white', padx=15, pady=8, state=tk.DISABLED)
+                    stop_btn.pack(side=tk.LEFT, padx=5)
+                    
+                    save_btn = tk.Button(btn_frame, text="💾 Use This", command=save_voice, bg=COLORS['info'], fg='white', padx=15, pady=8, state=tk.DISABLED)
+                    save_btn.pack(side=tk.LEFT, padx=5)
+                    
+                    cancel = functools.partial(self._close_recorder_dialog, rec_dialog)
+                    tk.Button(rec_dialog, text="Cancel", command=cancel, padx=15, pady=5).pack(pady=10)
+                    rec_dialog.protocol("WM_DELETE_WINDOW", cancel)
+                
+                rec_dialog.grab_set()
+            
+            # Record button
             tk.Button(
                 form,
-                text="🗑️ Remove Voice Note",
-                command=remove_voice,
-                bg=COLORS['danger'],
+                text="🎤 Record New Voice",
+                command=record_new_voice,
+                bg=COLORS['info'],
                 fg='white',
-                font=("Arial", 9),
+                font=self._fonts['small_bold'],
                 padx=10,
                 pady=5
             ).grid(row=row, column=1, pady=8, sticky=tk.W)
+            
             row += 1
-        
-        # Save button
-        def save():
-            reminder['title'] = title_entry.get().strip()
-            reminder['description'] = desc_entry.get().strip()
-            reminder['date'] = date_entry.get_date().strftime("%Y-%m-%d")
-            reminder['time'] = self.get_24hour_time(edit_hour_var.get(), edit_minute_var.get(), edit_ampm_var.get())
-            reminder['priority'] = priority_combo.get()
             
-            # Update voice note if new one recorded
-            if new_voice_note['path']:
-                reminder['voice_note'] = new_voice_note['path']
+            # Option to remove voice note
+            def remove_voice():
+                new_voice_note['path'] = None
+                new_voice_note['remove'] = True
+                voice_status_label.config(text="Current: None")
+                messagebox.showinfo("Info", "Voice note will be removed when you save")
             
-            self.save_data()
-            self.refresh_reminders_list()
-            messagebox.showinfo("Success", "Reminder updated!")
-            dialog.destroy()
-        
-        # Action buttons
-        btn_frame = tk.Frame(dialog, bg='white')
-        btn_frame.pack(pady=20)
-        
-        tk.Button(
-            btn_frame, 
-            text="💾 Save Changes", 
-            command=save, 
-            bg=COLORS['success'], 
-            fg='white',
-            font=("Arial", 11, "bold"),
-            padx=25, 
-            pady=10
-        ).pack(side=tk.LEFT, padx=10)
+            if current_voice:
+                tk.Button(
+                    form,
+                    text="🗑️ Remove Voice Note",
+                    command=remove_voice,
+                    bg=COLORS['danger'],
+                    fg='white',
+                    font=self._fonts['small'],
+                    padx=10,
+                    pady=5
+                ).grid(row=row, column=1, pady=8, sticky=tk.W)
+                row += 1
+            
+            # Save button
+            def save():
+                try:
+                    time_str = self.get_24hour_time(edit_hour_var.get(), edit_minute_var.get(), edit_ampm_var.get())
+                except (tk.TclError, ValueError):
+                    messagebox.showerror("Error", "Enter a valid time!", parent=dialog)
+                    return
+                
+                reminder['title'] = title_entry.get().strip()
+                reminder['description'] = desc_entry.get().strip()
+                reminder['date'] = date_entry.get_date().strftime("%Y-%m-%d")
+                reminder['time'] = time_str
+                reminder['priority'] = priority_combo.get()
+                reminder['trigger_epoch'] = self.get_trigger_epoch(reminder['date'], reminder['time'])
+                
+                # Update voice note if new one recorded
+                if new_voice_note['path']:
+                    reminder['voice_note'] = new_voice_note['path']
+                elif new_voice_note['remove']:
+                    reminder['voice_note'] = None
+                
+                self._fmt_row(reminder)
+                self.save_data()
+                if reminder['active']:
+                    self.schedule_item(reminder, 'reminder')
+                self.request_refresh(reminder['id'])
+                messagebox.showinfo("Success", "Reminder updated!")
+                dialog.destroy()
+            
+            # Action buttons
+            btn_frame = tk.Frame(dialog, bg='white')
+            btn_frame.pack(pady=20)
+            
+            tk.Button(
+                btn_frame, 
+                text="💾 Save Changes", 
+                command=save, 
+                bg=COLORS['success'], 
+                fg='white',
+                font=self._fonts['button'],
+                padx=25, 
+                pady=10
+            ).pack(side=tk.LEFT, padx=10)
+            
+            tk.Button(
+                btn_frame, 
+                text="❌ Cancel", 
+                command=dialog.destroy, 
+                bg=COLORS['danger'], 
+                fg='white',
+                font=self._fonts['button'],
+                padx=25, 
+                pady=10
+            ).pack(side=tk.LEFT, padx=10)
         
-        tk.Button(
-            btn_frame, 
-            text="❌ Cancel", 
-            command=dialog.destroy, 
-            bg=COLORS['danger'], 
-            fg='white',
-            font=("Arial", 11, "bold"),
-            padx=25, 
-            pady=10
-        ).pack(side=tk.LEFT, padx=10)
+        dialog.grab_set()
     
     def update_clock(self):
-        """Update live clock display"""
+        """Update live clock display on each wall-clock second"""
         if hasattr(self, 'clock_label'):
+            if self.root.state() == 'withdrawn':
+                # Nothing to paint while hidden; check back occasionally
+                self.root.after(5000, self.update_clock)
+                return
+            
             now = datetime.now()
-            time_str = now.strftime("%I:%M:%S %p")
-            date_str = now.strftime("%A, %B %d, %Y")
-            self.clock_label.config(text=f"{time_str} • {date_str}")
-            self.root.after(1000, self.update_clock)
+            
+            # The date part only changes at midnight
+            if now.toordinal() != self._clock_day:
+                self._clock_day = now.toordinal()
+                self._clock_date_str = now.strftime("%A, %B %d, %Y")
+            
+            self.clock_var.set(f"{now.strftime('%I:%M:%S %p')} • {self._clock_date_str}")
+            self.root.after(max(100, 1000 - now.microsecond // 1000), self.update_clock)
     
     def get_24hour_time(self, hour, minute, ampm):
         hour = int(hour)
         minute = int(minute)
+        # The spinboxes accept typed text, so the range isn't guaranteed
+        if not (1 <= hour <= 12 and 0 <= minute <= 59):
+            raise ValueError(f"invalid time {hour}:{minute:02d}")
         if ampm == "AM" and hour == 12:
             hour = 0
         elif ampm == "PM" and hour != 12:
             hour += 12
         return f"{hour:02d}:{minute:02d}"
     
+    def get_trigger_epoch(self, date, time_str):
+        """Convert stored date and 24-hour time strings to whole epoch seconds"""
+        return int(datetime.strptime(f"{date} {time_str}", "%Y-%m-%d %H:%M").timestamp())
+    
     def add_reminder_gui(self):
         """Add reminder"""
         title = self.reminder_title.get().strip()
@@ -986,124 +1294,272 @@ class ReminderApp:
             messagebox.showerror("Error", "Enter a title!")
             return
         
+        # Validated here so stored times always parse
+        try:
+            time_str = self.get_24hour_time(self.hour_var.get(), self.minute_var.get(), self.ampm_var.get())
+        except (tk.TclError, ValueError):
+            messagebox.showerror("Error", "Enter a valid time!")
+            return
+        
         reminder = {
             'id': int(time.time() * 1000),
             'title': title,
             'description': self.reminder_desc.get().strip(),
             'date': self.reminder_date.get_date().strftime("%Y-%m-%d"),
-            'time': self.get_24hour_time(self.hour_var.get(), self.minute_var.get(), self.ampm_var.get()),
+            'time': time_str,
             'priority': self.reminder_priority.get(),
             'active': True
         }
+        reminder['trigger_epoch'] = self.get_trigger_epoch(reminder['date'], reminder['time'])
         
         # Add voice note if recorded
         if self.pending_voice_note:
             reminder['voice_note'] = self.pending_voice_note
             self.pending_voice_note = None
         
-        self.reminders.append(reminder)
+        self._fmt_row(reminder)
+        self.reminders_by_id[reminder['id']] = reminder
         self.save_data()
+        self.schedule_item(reminder, 'reminder')
         
         self.reminder_title.delete(0, tk.END)
         self.reminder_desc.delete(0, tk.END)
         
-        self.refresh_reminders_list()
+        self.request_refresh(reminder['id'])
         messagebox.showinfo("Success", "Reminder added!")
     
+    def _fmt_row(self, reminder):
+        """Cache the tree row values shown for a reminder"""
+        priority = "🔴" if reminder['priority'] == 'urgent' else "🟢"
+        voice = "🎤" if reminder.get('voice_note') else ""
+        time_display = _TIME_DISPLAY.get(reminder['time'], reminder['time'])
+        
+        reminder['_display'] = (f"{priority} {voice}".strip(), reminder['title'], f"{reminder['date']} {time_display}")
+    
+    def request_refresh(self, reminder_id=None):
+        """Refresh the list once Tk is idle, coalescing repeated requests.
+        
+        Passing the id of the reminder that changed limits the update to its row.
+        """
+        if reminder_id is None:
+            self._refresh_all = True
+        else:
+            self._dirty_rows.add(reminder_id)
+        
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.root.after_idle(self._do_refresh)
+    
+    def _do_refresh(self):
+        self._refresh_pending = False
+        dirty, self._dirty_rows = self._dirty_rows, set()
+        if self._refresh_all:
+            self._refresh_all = False
+            self.refresh_reminders_list()
+        else:
+            for reminder_id in dirty:
+                self._update_row(reminder_id)
+    
+    def _update_row(self, reminder_id):
+        """Bring one tree row in line with its reminder"""
+        r = self.reminders_by_id.get(reminder_id)
+        values = r['_display'] if r and r['active'] else None
+        shown = self._tree_state.get(reminder_id)
+        if values == shown:
+            return
+        
+        if values is None:
+            self.reminders_tree.delete(reminder_id)
+            del self._tree_state[reminder_id]
+            return
+        
+        if shown is None:
+            # New reminders are added last to reminders_by_id, so END keeps the order
+            self.reminders_tree.insert('', tk.END, iid=reminder_id, values=values)
+        else:
+            self.reminders_tree.item(reminder_id, values=values)
+        self._tree_state[reminder_id] = values
+    
     def refresh_reminders_list(self):
-        """Refresh list"""
-        if hasattr(self, 'reminders_listbox'):
-            self.reminders_listbox.delete(0, tk.END)
-            for r in self.reminders:
-                if r['active']:
-                    priority = "🔴" if r['priority'] == 'urgent' else "🟢"
-                    voice = "🎤" if r.get('voice_note') else ""
-                    try:
-                        h24, m = r['time'].split(':')
-                        h24 = int(h24)
-                        ampm = "AM" if h24 < 12 else "PM"
-                        h12 = h24 if h24 <= 12 else h24 - 12
-                        if h12 == 0:
-                            h12 = 12
-                        time_display = f"{h12}:{m} {ampm}"
-                    except:
-                        time_display = r['time']
-                    
-                    text = f"{priority} {voice} {r['title']} | {r['date']} {time_display} | ID:{r['id']}"
-                    self.reminders_listbox.insert(tk.END, text)
+        """Refresh list, touching only the rows that changed"""
+        if hasattr(self, 'reminders_tree'):
+            for reminder_id in self._tree_state.keys() - self.reminders_by_id.keys():
+                self._update_row(reminder_id)
+            
+            for reminder_id in self.reminders_by_id:
+                self._update_row(reminder_id)
     
     def delete_reminder(self):
         """Delete reminder"""
-        selection = self.reminders_listbox.curselection()
+        selection = self.reminders_tree.selection()
         if not selection:
             messagebox.showwarning("Warning", "Select a reminder!")
             return
         
-        item_text = self.reminders_listbox.get(selection[0])
-        try:
-            reminder_id = int(item_text.split("ID:")[1].strip())
-            self.reminders = [r for r in self.reminders if r['id'] != reminder_id]
+        reminder = self.reminders_by_id.pop(int(selection[0]), None)
+        if reminder:
+            self._reschedule()
             self.save_data()
-            self.refresh_reminders_list()
+            self.request_refresh(reminder['id'])
             messagebox.showinfo("Success", "Deleted!")
-        except:
-            pass
     
-    def check_reminders(self):
-        """Check reminders"""
-        now = datetime.now()
-        current_date = now.strftime("%Y-%m-%d")
-        current_time = now.strftime("%H:%M")
-        
-        for reminder in self.reminders:
-            if reminder['active'] and reminder['date'] == current_date and reminder['time'] == current_time:
-                self.show_fullscreen_alert(
-                    f"REMINDER: {reminder['title']}",
-                    reminder['description'],
-                    reminder['id'],
-                    reminder.get('voice_note')
-                )
-                reminder['active'] = False
-                self.save_data()
-                if hasattr(self, 'root'):
-                    try:
-                        self.root.after(100, self.refresh_reminders_list)
-                    except:
-                        pass
+    def fire_reminder(self, reminder):
+        """Show a due reminder and mark it done"""
+        self.show_fullscreen_alert(
+            f"REMINDER: {reminder['title']}",
+            reminder['description'],
+            reminder['id'],
+            reminder.get('voice_note')
+        )
+        reminder['active'] = False
+        self.save_data()
+        self.request_refresh(reminder['id'])
+    
+    def fire_snoozed(self, item):
+        """Show a snoozed alert again"""
+        self.show_fullscreen_alert(item['title'], item['message'], item['original_id'], item.get('custom_voice'))
     
     def load_data(self):
         """Load data"""
+        reminders = []
         if os.path.exists(DATA_FILE):
             try:
-                with open(DATA_FILE, 'r') as f:
-                    data = json.load(f)
-                    self.reminders = data.get('reminders', [])
+                with open(DATA_FILE, 'rb') as f:
+                    data = json_loads(f.read())
+                    reminders = data.get('reminders', [])
                     self.alarms = data.get('alarms', [])
-            except:
-                pass
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"Data load error: {e}")
+        
+        # Parse trigger times once; the date/time strings are kept for display
+        for r in reminders:
+            try:
+                r['trigger_epoch'] = self.get_trigger_epoch(r['date'], r['time'])
+            except (KeyError, ValueError):
+                r['trigger_epoch'] = None
+            self._fmt_row(r)
+        
+        self.reminders_by_id = {r['id']: r for r in reminders}
     
     def save_data(self):
-        """Save data"""
-        with open(DATA_FILE, 'w') as f:
-            json.dump({'reminders': self.reminders, 'alarms': self.alarms}, f, indent=2)
+        """Mark data as changed; a burst of changes is written once"""
+        if not self._data_dirty:
+            self._data_dirty = True
+            self.root.after(DATA_SAVE_DELAY_MS, self.flush_data)
+    
+    def flush_data(self):
+        """Write data to disk if it changed"""
+        if not self._data_dirty:
+            return
+        self._data_dirty = False
+        
+        # Snapshot on this thread; underscore keys are display caches rebuilt on load
+        state = {
+            'reminders': [{k: v for k, v in r.items() if not k.startswith('_')} for r in self.reminders_by_id.values()],
+            'alarms': [dict(a) for a in self.alarms]
+        }
+        self._write_q.put((DATA_FILE, state))
     
-    def monitor_loop(self):
-        """Monitor loop"""
-        while self.running:
+    def _writer_loop(self):
+        """Write settings/data snapshots to disk off the Tk thread"""
+        last_written = {}  # path -> bytes last written there
+        while True:
+            batch = [self._write_q.get()]
+            while True:
+                try:
+                    batch.append(self._write_q.get_nowait())
+                except queue.Empty:
+                    break
+            
             try:
-                self.check_reminders()
-                self.check_snoozed()
-            except:
-                pass
-            time.sleep(30)
+                # Only the newest snapshot of each file in a burst is written
+                for path, state in dict(batch).items():
+                    try:
+                        payload = json_dumps(state)
+                        if last_written.get(path) == payload:
+                            continue
+                        # Write a temp file and rename it so a crash never leaves a truncated file
+                        tmp = path + '.tmp'
+                        with open(tmp, 'wb') as f:
+                            f.write(payload)
+                            # Flush to disk before the rename, or a power loss can leave an empty file
+                            f.flush()
+                            os.fsync(f.fileno())
+                        os.replace(tmp, path)
+                        last_written[path] = payload
+                    except (OSError, TypeError, ValueError) as e:
+                        print(f"Save error: {e}")
+            finally:
+                # quit_app joins the queue, so every item must be marked done whatever happened
+                for _ in batch:
+                    self._write_q.task_done()
     
-    def start_monitor_thread(self):
-        """Start monitor"""
-        threading.Thread(target=self.monitor_loop, daemon=False).start()
+    def start_scheduler(self):
+        """Queue all upcoming reminders and arm the timer"""
+        cutoff = time.time() - MISSED_GRACE_SECONDS
+        for r in self.reminders_by_id.values():
+            # Reminders missed while the app was closed are not replayed
+            if r['active'] and r['trigger_epoch'] is not None and r['trigger_epoch'] >= cutoff:
+                heapq.heappush(self._pending, (r['trigger_epoch'], 'reminder', r['id']))
+        self._reschedule()
+    
+    def schedule_item(self, item, kind):
+        """Queue a reminder or snoozed item for its trigger time"""
+        # Same rule as start_scheduler, so a reminder saved in the past doesn't alert at once
+        if kind == 'reminder' and item['trigger_epoch'] < time.time() - MISSED_GRACE_SECONDS:
+            return
+        heapq.heappush(self._pending, (item['trigger_epoch'], kind, item['id']))
+        self._reschedule()
+    
+    def _lookup_pending(self, entry):
+        """Return the item behind a heap entry, or None if it was deleted or edited since"""
+        epoch, kind, item_id = entry
+        items = self.reminders_by_id if kind == 'reminder' else self.snoozed_items
+        item = items.get(item_id)
+        if item and item['active'] and item['trigger_epoch'] == epoch:
+            return item
+        return None
+    
+    def _reschedule(self):
+        """Arm a single timer for the next due item"""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        
+        # Don't wake up for entries left behind by deletes and edits
+        while self._pending and self._lookup_pending(self._pending[0]) is None:
+            heapq.heappop(self._pending)
+        
+        if self._pending:
+            delay_ms = int((self._pending[0][0] - time.time()) * 1000)
+            self._after_id = self.root.after(min(max(delay_ms, 0), MAX_TIMER_MS), self._fire_due)
+    
+    def _fire_due(self):
+        """Fire every queued item whose trigger time has passed"""
+        self._after_id = None
+        now = time.time()
+        
+        try:
+            while self._pending and self._pending[0][0] <= now:
+                entry = heapq.heappop(self._pending)
+                item = self._lookup_pending(entry)
+                if item is None:
+                    continue
+                
+                if entry[1] == 'reminder':
+                    self.fire_reminder(item)
+                else:
+                    del self.snoozed_items[item['id']]
+                    self.fire_snoozed(item)
+        finally:
+            self._reschedule()
     
     def on_closing(self):
         """Handle close"""
-        if TRAY_AVAILABLE:
+        self.flush_settings()
+        self.flush_data()
+        # Only hide if the tray actually came up, otherwise there'd be no way back
+        if self.tray_icon:
             self.hide_window()
         else:
             if messagebox.askokcancel("Quit", "Stop monitoring?"):
@@ -1113,11 +1569,8 @@ class ReminderApp:
         """Run app"""
         try:
             self.root.mainloop()
-        except:
+        except KeyboardInterrupt:
             pass
-        
-        while self.running:
-            time.sleep(1)
 
 if __name__ == "__main__":
     print("🚀 Starting Reminder App...")
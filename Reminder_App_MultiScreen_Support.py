@@ -7,22 +7,27 @@ Features:
 - Voice notes, snooze, edit, fullscreen alerts
 """
 
+import atexit
+import hashlib
+import importlib
 import subprocess
 import sys
 import os
+from importlib.util import find_spec
 
 # Auto-install function
-def install_package(package):
-    """Auto-install missing packages"""
+def install_packages(packages):
+    """Auto-install missing packages with a single pip run"""
+    # Installs go through "python -m pip", so check for pip itself rather than a pip on PATH
+    if find_spec('pip') is None:
+        print("  ✗ pip is not available for this Python")
+        return False
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", package, "--quiet"])
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "--quiet", *packages])
         return True
-    except:
+    except (subprocess.CalledProcessError, OSError):
         return False
 
-# Check and install required packages
-print("🔍 Checking required packages...")
-
 required_packages = {
     'tkcalendar': 'tkcalendar',
     'pystray': 'pystray',
@@ -32,30 +37,64 @@ required_packages = {
     'screeninfo': 'screeninfo'
 }
 
-for module_name, package_name in required_packages.items():
+# Written after a successful check; the check is skipped until the package list
+# or the interpreter changes (each venv has its own site-packages)
+DEPS_MARKER_FILE = os.path.join(os.path.expanduser("~"), ".reminder_app_deps_ok")
+deps_hash = hashlib.sha1(repr((sys.executable, sys.prefix, sorted(required_packages.items()))).encode()).hexdigest()
+
+def deps_already_checked():
     try:
-        __import__(module_name)
-        print(f"  ✓ {package_name} already installed")
-    except ImportError:
-        print(f"  ⚠ {package_name} not found. Installing...")
-        if install_package(package_name):
-            print(f"  ✓ {package_name} installed successfully!")
+        with open(DEPS_MARKER_FILE, 'r') as f:
+            return f.read().strip() == deps_hash
+    except OSError:
+        return False
+
+# Check and install required packages
+if not deps_already_checked():
+    print("🔍 Checking required packages...")
+    
+    missing = []
+    for module_name, package_name in required_packages.items():
+        if find_spec(module_name) is None:
+            print(f"  ⚠ {package_name} not found")
+            missing.append(package_name)
+        else:
+            print(f"  ✓ {package_name} already installed")
+    
+    if missing:
+        print(f"  Installing {' '.join(missing)}...")
+        installed = install_packages(missing)
+        if installed:
+            # Let the imports below see the new packages
+            importlib.invalidate_caches()
+            print("  ✓ Installed successfully!")
         else:
-            print(f"  ✗ Failed to install {package_name}")
+            print("  ✗ Failed to install missing packages")
+    
+    if not missing or installed:
+        try:
+            with open(DEPS_MARKER_FILE, 'w') as f:
+                f.write(deps_hash)
+        except OSError:
+            pass
 
 print("\n🚀 Starting Reminder App...\n")
 
 # Now import everything
+import functools
+import heapq
+import itertools
 import json
+import queue
 import time
 import threading
 from datetime import datetime, timedelta
 import wave
+from collections import deque
 
 # GUI libraries
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-from tkcalendar import DateEntry
 
 # System tray
 try:
@@ -63,38 +102,102 @@ try:
     from pystray import MenuItem as item
     from PIL import Image, ImageDraw
     TRAY_AVAILABLE = True
-except:
+except ImportError:
     TRAY_AVAILABLE = False
 
-# Audio
-try:
-    import pygame
-    pygame.mixer.init()
-    AUDIO_AVAILABLE = True
-except:
-    AUDIO_AVAILABLE = False
+# Audio and voice recording; both are only imported on first use
+AUDIO_AVAILABLE = find_spec('pygame') is not None
+VOICE_AVAILABLE = find_spec('pyaudio') is not None
+
+_mixer_ready = False
 
-# Voice recording
+# find_spec only proves a package is installed; the getters below return None
+# (and mark the feature unavailable) when its native libraries fail to load
+
+@functools.cache
+def get_pygame():
+    """Import pygame and start its mixer, or None if it won't load"""
+    global AUDIO_AVAILABLE, _mixer_ready
+    try:
+        import pygame
+    except ImportError as e:
+        print(f"Audio error: {e}")
+        AUDIO_AVAILABLE = False
+        return None
+    _mixer_ready = True
+    try:
+        pygame.mixer.init()
+    except pygame.error as e:
+        print(f"Audio error: {e}")
+    return pygame
+
+@functools.cache
+def get_pyaudio():
+    """Import pyaudio, or None if it won't load"""
+    global VOICE_AVAILABLE
+    try:
+        import pyaudio
+    except ImportError as e:
+        print(f"Voice error: {e}")
+        VOICE_AVAILABLE = False
+        return None
+    return pyaudio
+
+@functools.cache
+def get_date_entry():
+    """Import tkcalendar's DateEntry (slow: it loads babel locale data), or None if it won't load"""
+    try:
+        from tkcalendar import DateEntry
+    except ImportError as e:
+        print(f"Calendar error: {e}")
+        return None
+    return DateEntry
+
+# Fast JSON (optional)
 try:
-    import pyaudio
-    VOICE_AVAILABLE = True
-except:
-    VOICE_AVAILABLE = False
+    import orjson
+    
+    def json_dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def json_dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode()
 
 # Screen detection
 try:
     from screeninfo import get_monitors
     SCREEN_DETECTION = True
-except:
+except ImportError:
     SCREEN_DETECTION = False
 
 # Data files
 DATA_FILE = os.path.join(os.path.expanduser("~"), "reminder_app_data.json")
 SETTINGS_FILE = os.path.join(os.path.expanduser("~"), "reminder_app_settings.json")
+SCREENS_CACHE_FILE = os.path.join(os.path.expanduser("~"), "reminder_screens_cache.json")
 VOICE_NOTES_DIR = os.path.join(os.path.expanduser("~"), "reminder_voice_notes")
 
 os.makedirs(VOICE_NOTES_DIR, exist_ok=True)
 
+# Voice note format (16-bit mono) and the longest recording kept
+VOICE_RATE = 44100
+VOICE_CHUNK = 1024
+MAX_RECORDING_SECONDS = 600
+
+# Delay before a settings/data change is written, so quick edits cost one write
+SETTINGS_SAVE_DELAY_MS = 2000
+DATA_SAVE_DELAY_MS = 500
+
+# Longest single wait of the scheduler timer; re-arming at least once a minute
+# keeps it on time across system sleep and clock changes
+MAX_TIMER_MS = 60 * 1000
+
+# Reminders due further back than this are never fired, whether they were
+# missed while the app was closed or saved with a time already in the past
+MISSED_GRACE_SECONDS = 60
+
+# How often the Tk thread checks whether screen detection has finished
+SCREEN_POLL_MS = 100
+
 # Colors
 COLORS = {
     'primary': '#667eea',
@@ -110,43 +213,59 @@ class VoiceRecorder:
     """Simple voice recorder"""
     def __init__(self):
         self.recording = False
-        self.frames = []
+        self.buf = None
+        self.pos = 0
         self.audio = None
         self.stream = None
-        
-        if VOICE_AVAILABLE:
-            try:
-                self.audio = pyaudio.PyAudio()
-            except:
-                pass
+        self._stopped = threading.Event()  # set once the recorder thread has exited
     
     def start_recording(self):
-        if not VOICE_AVAILABLE or not self.audio:
+        pyaudio = get_pyaudio() if VOICE_AVAILABLE else None
+        if pyaudio is None:
             return False
         
         try:
+            # PortAudio probes every audio device, so it's only started when first needed
+            if self.audio is None:
+                self.audio = pyaudio.PyAudio()
+            
+            # Allocated on first use and reused; each recording writes it from the start
+            if self.buf is None:
+                self.buf = bytearray(VOICE_RATE * 2 * MAX_RECORDING_SECONDS)
+            self.pos = 0
             self.recording = True
-            self.frames = []
+            self._stopped.clear()
             
             self.stream = self.audio.open(
                 format=pyaudio.paInt16,
                 channels=1,
-                rate=44100,
+                rate=VOICE_RATE,
                 input=True,
-                frames_per_buffer=1024
+                frames_per_buffer=VOICE_CHUNK
             )
             
             def record_thread():
-                while self.recording:
-                    try:
-                        data = self.stream.read(1024)
-                        self.frames.append(data)
-                    except:
-                        break
+                mv = memoryview(self.buf)
+                try:
+                    while self.recording:
+                        try:
+                            # An overflow only drops samples; don't raise for it
+                            data = self.stream.read(VOICE_CHUNK, exception_on_overflow=False)
+                        except OSError:
+                            break
+                        end = self.pos + len(data)
+                        if end > len(mv):
+                            break
+                        mv[self.pos:end] = data
+                        self.pos = end
+                finally:
+                    mv.release()
+                    self._stopped.set()
             
             threading.Thread(target=record_thread, daemon=True).start()
             return True
-        except Exception as e:
+        except OSError as e:
+            self.recording = False
             print(f"Recording error: {e}")
             return False
     
@@ -156,7 +275,8 @@ class VoiceRecorder:
         
         try:
             self.recording = False
-            time.sleep(0.2)
+            # Returns as soon as the current read finishes and the thread exits
+            self._stopped.wait(timeout=1.0)
             
             if self.stream:
                 self.stream.stop_stream()
@@ -165,26 +285,65 @@ class VoiceRecorder:
             filepath = os.path.join(VOICE_NOTES_DIR, filename)
             with wave.open(filepath, 'wb') as wf:
                 wf.setnchannels(1)
-                wf.setsampwidth(self.audio.get_sample_size(pyaudio.paInt16))
-                wf.setframerate(44100)
-                wf.writeframes(b''.join(self.frames))
+                wf.setsampwidth(self.audio.get_sample_size(get_pyaudio().paInt16))
+                wf.setframerate(VOICE_RATE)
+                with memoryview(self.buf)[:self.pos] as samples:
+                    wf.writeframes(samples)
             
             return filepath
-        except Exception as e:
+        except (OSError, wave.Error) as e:
             print(f"Save error: {e}")
             return False
 
 class ReminderApp:
     def __init__(self):
-        self.reminders = []
+        self.reminders_by_id = {}  # id -> reminder, in the order they were added
         self.alarms = []
-        self.snoozed_items = []
+        self.snoozed_items = {}  # id -> snoozed alert
+        # Ids for new reminders and snoozes; unique even when several are made in the same millisecond
+        self._id_counter = itertools.count(time.time_ns())
         self.running = True
+        
+        # Min-heap of (trigger_epoch, kind, id); entries for deleted or edited
+        # items are left in place and skipped when they come up
+        self._due_heap = []
+        self._after_id = None  # the armed scheduler timer
         self.custom_tone_path = None
         self.pending_voice_note = None
         self.voice_recorder = VoiceRecorder()
+        self.tray_icon = None
+        self._alarm_sound = None  # custom tone decoded into memory, if pygame can
+        self._sound_channel = None
+        self._refresh_pending = False
+        self._rendered_rows = ()  # listbox text as last drawn
+        self._listbox_ids = []  # reminder id of each listbox row
+        self._clock_job = None
+        
+        # Last settings read from or written to disk, and that file's mtime
+        self._settings_cache = None
+        self._settings_mtime = 0
+        self._settings_dirty = False
+        
+        # Data saves are coalesced here and written by a background thread
+        self._data_dirty = False
+        self._write_q = queue.Queue()
+        threading.Thread(target=self._writer_loop, daemon=True).start()
+        
+        # Root is created first (hidden) so screen detection can use Tk's screen size
+        self.root = tk.Tk()
+        self.root.withdraw()
+        
+        # One hidden alert window per screen, built up front so alerts appear immediately
+        self._alert_pool = {}
+        self._shown_alerts = []
+        self._alert_info = None  # (title, message, item_id, custom_voice) of the visible alert
+        self._alert_queue = deque()
         
-        # Detect screens
+        # Screen lists found by the detection worker, waiting to be applied on the Tk thread
+        self._screens_q = queue.Queue()
+        
+        # Detect screens (the pool is built once the screens are known)
+        self.screens = []
         self.detect_screens()
         
         # Alert settings
@@ -193,15 +352,66 @@ class ReminderApp:
         
         self.load_data()
         self.load_settings()
+        atexit.register(self.flush_settings)
         
-        self.start_monitor_thread()
+        self.start_scheduler()
         if TRAY_AVAILABLE:
-            self.setup_tray_icon()
+            # Drawing the icon and starting pystray doesn't touch Tk, so it overlaps GUI setup
+            threading.Thread(target=self.setup_tray_icon, daemon=True).start()
         self.create_gui()
+        # Decoding the tone starts the mixer, so it waits until the window is up
+        self.root.after_idle(self.preload_custom_tone)
     
-    def detect_screens(self):
-        """Detect all available screens"""
-        self.screens = []
+    def detect_screens(self, use_cache=True):
+        """Apply the cached screen layout if there is one, then detect screens on a worker thread"""
+        # Tk's screen size is cheap to read, but on Windows and macOS it is only the
+        # primary monitor's, so it can't tell when a second monitor is plugged in
+        fingerprint = [self.root.winfo_screenwidth(), self.root.winfo_screenheight()]
+        # Kept for centring dialogs without asking Tk again
+        self._screen_size = tuple(fingerprint)
+        
+        if use_cache and os.path.exists(SCREENS_CACHE_FILE):
+            try:
+                with open(SCREENS_CACHE_FILE, 'r') as f:
+                    cached = json.load(f)
+                if cached.get('fingerprint') == fingerprint and cached.get('screens'):
+                    print(f"\n✓ Using {len(cached['screens'])} cached screen(s)")
+                    self.apply_screens(cached['screens'])
+            except (OSError, ValueError) as e:
+                print(f"Screen cache error: {e}")
+        
+        # Until detection finishes, alerts go to the cached or default screens.
+        # Detection still runs on a cache hit, to catch monitors the fingerprint misses
+        if not self.screens:
+            self.apply_screens([])
+        threading.Thread(target=self._detect_screens_worker, args=(fingerprint,), daemon=True).start()
+        self.root.after(SCREEN_POLL_MS, self._poll_screens)
+    
+    def _poll_screens(self):
+        """Apply the worker's screen list once it arrives"""
+        try:
+            screens = self._screens_q.get_nowait()
+        except queue.Empty:
+            self.root.after(SCREEN_POLL_MS, self._poll_screens)
+            return
+        
+        # Keep the current screens (and alert pool) if detection failed or found the same layout
+        if screens and self._layout_key(screens) != self._screen_layout:
+            self.apply_screens(screens)
+    
+    @staticmethod
+    def _layout_key(screens):
+        """What identifies a screen layout, ignoring the geometry strings added by apply_screens"""
+        return tuple((s['x'], s['y'], s['width'], s['height'], s['is_primary']) for s in screens)
+    
+    def _center_position(self, width, height):
+        """Geometry string that centres a window of the given size on the screen"""
+        screen_w, screen_h = self._screen_size
+        return f"+{(screen_w - width) // 2}+{(screen_h - height) // 2}"
+    
+    def _detect_screens_worker(self, fingerprint):
+        """Query the monitors and cache them; runs off the Tk thread"""
+        screens = []
         
         if SCREEN_DETECTION:
             try:
@@ -216,11 +426,28 @@ class ReminderApp:
                         'height': monitor.height,
                         'is_primary': monitor.is_primary if hasattr(monitor, 'is_primary') else (idx == 0)
                     }
-                    self.screens.append(screen_info)
+                    screens.append(screen_info)
                     print(f"  🖥️  Screen {idx + 1}: {monitor.width}x{monitor.height} at ({monitor.x}, {monitor.y})")
             except Exception as e:
+                # screeninfo's platform backends raise their own error types
                 print(f"Screen detection error: {e}")
         
+        if screens:
+            try:
+                with open(SCREENS_CACHE_FILE, 'w') as f:
+                    json.dump({'fingerprint': fingerprint, 'screens': screens}, f)
+            except OSError as e:
+                print(f"Screen cache error: {e}")
+        
+        # Tk calls from this thread fail unless mainloop is already running, so the
+        # Tk thread picks the result up in _poll_screens
+        self._screens_q.put(screens)
+    
+    def apply_screens(self, screens):
+        """Switch to a new screen list and rebuild everything that depends on it"""
+        self._screen_layout = self._layout_key(screens)
+        self.screens = screens
+        
         # Fallback: if no screens detected, use default
         if not self.screens:
             self.screens = [{
@@ -233,7 +460,25 @@ class ReminderApp:
                 'is_primary': True
             }]
         
+        for screen in self.screens:
+            self.add_screen_geometry(screen)
+        
         print(f"\n✓ Detected {len(self.screens)} screen(s)")
+        
+        self.build_alert_pool()
+        if hasattr(self, 'screen_list_frame'):
+            self.populate_screen_list()
+            self.status_label.config(text=f"✓ Running | Screens: {len(self.screens)}")
+    
+    def add_screen_geometry(self, screen):
+        """Precompute the fullscreen and windowed alert geometries for a screen"""
+        w, h, x, y = screen['width'], screen['height'], screen['x'], screen['y']
+        screen['fs_geom'] = f"{w}x{h}+{x}+{y}"
+        
+        # Windowed alerts use 80% of the screen, centered
+        w8 = int(w * 0.8)
+        h8 = int(h * 0.8)
+        screen['win_geom_80'] = f"{w8}x{h8}+{x + (w - w8) // 2}+{y + (h - h8) // 2}"
     
     def get_primary_screen(self):
         """Get primary screen info"""
@@ -243,26 +488,62 @@ class ReminderApp:
         return self.screens[0] if self.screens else None
     
     def load_settings(self):
-        if os.path.exists(SETTINGS_FILE):
+        try:
+            mtime = os.stat(SETTINGS_FILE).st_mtime
+        except OSError:
+            return
+        
+        # Only re-read the file if it changed since it was last read or written
+        if mtime != self._settings_mtime:
             try:
                 with open(SETTINGS_FILE, 'r') as f:
-                    settings = json.load(f)
-                    self.custom_tone_path = settings.get('custom_tone_path')
-                    self.fullscreen_mode = settings.get('fullscreen_mode', True)
-                    self.selected_screens = settings.get('selected_screens', 'all')
-            except:
-                pass
+                    self._settings_cache = json.load(f)
+                self._settings_mtime = mtime
+            except (OSError, ValueError) as e:
+                print(f"Settings load error: {e}")
+                return
+        
+        settings = self._settings_cache
+        self.custom_tone_path = settings.get('custom_tone_path')
+        self.fullscreen_mode = settings.get('fullscreen_mode', True)
+        self.selected_screens = settings.get('selected_screens', 'all')
     
     def save_settings(self):
+        """Schedule a settings write; unchanged settings aren't written at all"""
         settings = {
             'custom_tone_path': self.custom_tone_path,
             'fullscreen_mode': self.fullscreen_mode,
             'selected_screens': self.selected_screens
         }
-        with open(SETTINGS_FILE, 'w') as f:
-            json.dump(settings, f, indent=2)
+        if settings == self._settings_cache:
+            return
+        
+        self._settings_cache = settings
+        if not self._settings_dirty:
+            self._settings_dirty = True
+            self.root.after(SETTINGS_SAVE_DELAY_MS, self.flush_settings)
     
-    def create_tray_icon_image(self):
+    def flush_settings(self):
+        """Write pending settings to disk"""
+        if not self._settings_dirty:
+            return
+        self._settings_dirty = False
+        try:
+            # Write a temp file and rename it so a crash never leaves a truncated file
+            tmp = SETTINGS_FILE + '.tmp'
+            with open(tmp, 'w') as f:
+                json.dump(self._settings_cache, f, separators=(',', ':'))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, SETTINGS_FILE)
+            self._settings_mtime = os.stat(SETTINGS_FILE).st_mtime
+        except OSError as e:
+            print(f"Settings save error: {e}")
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def create_tray_icon_image():
+        """Draw the tray icon; the result only depends on COLORS so it is cached"""
         width = 64
         height = 64
         image = Image.new('RGB', (width, height), 'white')
@@ -281,60 +562,99 @@ class ReminderApp:
         try:
             icon_image = self.create_tray_icon_image()
             menu = pystray.Menu(
-                item('Show', self.show_window, default=True),
-                item('Exit', self.quit_app)
+                item('Show', self._from_tray(self.show_window), default=True),
+                item('Exit', self._from_tray(self.quit_app))
             )
             self.tray_icon = pystray.Icon("ReminderApp", icon_image, "Reminder App", menu)
-            threading.Thread(target=self.tray_icon.run, daemon=False).start()
-        except:
-            pass
+            # Daemon so quitting never waits on the tray loop; stop() is thread-safe
+            threading.Thread(target=self.tray_icon.run, daemon=True).start()
+        except Exception as e:
+            # pystray backends raise their own error types
+            print(f"Tray error: {e}")
     
     def show_window(self, icon=None, item=None):
         if hasattr(self, 'root'):
             self.root.deiconify()
             self.root.lift()
+            if self._clock_job is None:
+                self.update_clock()
     
     def hide_window(self):
         if hasattr(self, 'root'):
             self.root.withdraw()
+            # Nobody sees the clock while the app sits in the tray
+            if self._clock_job is not None:
+                self.root.after_cancel(self._clock_job)
+                self._clock_job = None
+    
+    def _from_tray(self, callback):
+        """Wrap a tray menu action so it runs on the Tk thread"""
+        return lambda: self.root.after(0, callback)
     
     def quit_app(self, icon=None, item=None):
         self.running = False
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self.flush_data()
+        self._write_q.join()
         if self.tray_icon:
             self.tray_icon.stop()
         if hasattr(self, 'root'):
             try:
                 self.root.quit()
-            except:
+            except (tk.TclError, RuntimeError):
                 pass
         sys.exit(0)
     
     def play_alarm_sound(self, custom_path=None):
-        if not AUDIO_AVAILABLE:
+        pygame = get_pygame() if AUDIO_AVAILABLE else None
+        if pygame is None:
             print('\a')
             return
         
         try:
+            if not custom_path and self._alarm_sound:
+                self._sound_channel = self._alarm_sound.play(loops=-1)
+                return
+            
             sound_path = custom_path or self.custom_tone_path
             if sound_path and os.path.exists(sound_path):
                 pygame.mixer.music.load(sound_path)
                 pygame.mixer.music.play(-1)
             else:
                 print('\a')
-        except Exception as e:
+        except pygame.error as e:
             print(f"Audio error: {e}")
             print('\a')
     
     def stop_alarm_sound(self):
-        if AUDIO_AVAILABLE:
+        # Nothing can be playing before the mixer was started
+        if _mixer_ready:
+            pygame = get_pygame()
             try:
                 pygame.mixer.music.stop()
-            except:
+                if self._sound_channel:
+                    self._sound_channel.stop()
+                    self._sound_channel = None
+            except pygame.error:
                 pass
     
+    def preload_custom_tone(self):
+        """Decode the custom tone once so alarms don't reload it from disk"""
+        self._alarm_sound = None
+        if AUDIO_AVAILABLE and self.custom_tone_path and os.path.exists(self.custom_tone_path):
+            pygame = get_pygame()
+            if pygame is None:
+                return
+            try:
+                self._alarm_sound = pygame.mixer.Sound(self.custom_tone_path)
+            except pygame.error as e:
+                # Formats Sound can't decode still play through mixer.music
+                print(f"Audio preload error: {e}")
+    
     def create_gui(self):
         """Create clean, properly sized GUI"""
-        self.root = tk.Tk()
         self.root.title("⏰ Reminder App")
         
         # Get primary screen for window positioning
@@ -353,6 +673,16 @@ class ReminderApp:
         self.root.geometry(f"{win_width}x{win_height}+{x}+{y}")
         self.root.configure(bg='white')
         
+        # Shared label styles for the tabs, so each label doesn't repeat bg/font/fg options
+        style = ttk.Style(self.root)
+        style.configure("App.TLabel", background='white', font=("Arial", 10))
+        style.configure("Bold.App.TLabel", font=("Arial", 10, "bold"))
+        style.configure("Large.App.TLabel", font=("Arial", 12))
+        style.configure("Separator.App.TLabel", font=("Arial", 12, "bold"))
+        style.configure("Count.App.TLabel", font=("Arial", 10, "bold"), foreground=COLORS['success'])
+        style.configure("Screen.App.TLabel", font=("Arial", 9), foreground=COLORS['info'])
+        style.configure("Tone.App.TLabel", foreground=COLORS['primary'])
+        
         # Header with clock
         header = tk.Frame(self.root, bg=COLORS['primary'], height=70)
         header.pack(fill=tk.X)
@@ -375,6 +705,8 @@ class ReminderApp:
             fg='white'
         )
         self.clock_label.pack()
+        self._cached_date_ymd = None
+        self._cached_date_str = ""
         self.update_clock()
         
         # Notebook
@@ -391,24 +723,31 @@ class ReminderApp:
         status_frame.pack(side=tk.BOTTOM, fill=tk.X)
         status_frame.pack_propagate(False)
         
-        tk.Label(
+        self.status_label = tk.Label(
             status_frame, 
             text=f"✓ Running | Screens: {len(self.screens)}", 
             bg=COLORS['success'], 
             fg='white',
             font=("Arial", 9, "bold")
-        ).pack(pady=5)
+        )
+        self.status_label.pack(pady=5)
         
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        self.root.deiconify()
     
     def update_clock(self):
-        """Update live clock display"""
+        """Update live clock display on each wall-clock second"""
         if hasattr(self, 'clock_label'):
             now = datetime.now()
-            time_str = now.strftime("%I:%M:%S %p")
-            date_str = now.strftime("%A, %B %d, %Y")
-            self.clock_label.config(text=f"{time_str} • {date_str}")
-            self.root.after(1000, self.update_clock)
+            
+            # The date part only changes at midnight
+            if now.toordinal() != self._cached_date_ymd:
+                self._cached_date_ymd = now.toordinal()
+                self._cached_date_str = now.strftime("%A, %B %d, %Y")
+            
+            self.clock_label.config(text=f"{now.strftime('%I:%M:%S %p')} • {self._cached_date_str}")
+            # Aim just past the next second so ticks don't drift
+            self._clock_job = self.root.after(1000 - now.microsecond // 1000, self.update_clock)
     
     def create_reminders_tab(self):
         """Clean reminders tab"""
@@ -421,22 +760,23 @@ class ReminderApp:
         
         # Form fields in grid
         row = 0
-        tk.Label(add_frame, text="Title:", bg='white', font=("Arial", 10)).grid(row=row, column=0, sticky=tk.W, pady=5)
+        ttk.Label(add_frame, text="Title:", style="App.TLabel").grid(row=row, column=0, sticky=tk.W, pady=5)
         self.reminder_title = tk.Entry(add_frame, width=50, font=("Arial", 10))
         self.reminder_title.grid(row=row, column=1, pady=5, sticky=tk.W)
         
         row += 1
-        tk.Label(add_frame, text="Description:", bg='white', font=("Arial", 10)).grid(row=row, column=0, sticky=tk.W, pady=5)
+        ttk.Label(add_frame, text="Description:", style="App.TLabel").grid(row=row, column=0, sticky=tk.W, pady=5)
         self.reminder_desc = tk.Entry(add_frame, width=50, font=("Arial", 10))
         self.reminder_desc.grid(row=row, column=1, pady=5, sticky=tk.W)
         
         row += 1
-        tk.Label(add_frame, text="Date:", bg='white', font=("Arial", 10)).grid(row=row, column=0, sticky=tk.W, pady=5)
-        self.reminder_date = DateEntry(add_frame, width=20, font=("Arial", 10))
-        self.reminder_date.grid(row=row, column=1, pady=5, sticky=tk.W)
+        ttk.Label(add_frame, text="Date:", style="App.TLabel").grid(row=row, column=0, sticky=tk.W, pady=5)
+        # Importing tkcalendar is slow, so the date picker is added once the window is up
+        self.reminder_date = None
+        self.root.after_idle(self._create_add_date_entry, add_frame, row)
         
         row += 1
-        tk.Label(add_frame, text="Time:", bg='white', font=("Arial", 10)).grid(row=row, column=0, sticky=tk.W, pady=5)
+        ttk.Label(add_frame, text="Time:", style="App.TLabel").grid(row=row, column=0, sticky=tk.W, pady=5)
         
         # Time picker inline
         time_frame = tk.Frame(add_frame, bg='white')
@@ -444,7 +784,7 @@ class ReminderApp:
         
         self.hour_var = tk.IntVar(value=12)
         tk.Spinbox(time_frame, from_=1, to=12, textvariable=self.hour_var, width=3, font=("Arial", 10)).pack(side=tk.LEFT, padx=2)
-        tk.Label(time_frame, text=":", bg='white', font=("Arial", 12, "bold")).pack(side=tk.LEFT)
+        ttk.Label(time_frame, text=":", style="Separator.App.TLabel").pack(side=tk.LEFT)
         self.minute_var = tk.IntVar(value=0)
         tk.Spinbox(time_frame, from_=0, to=59, textvariable=self.minute_var, width=3, font=("Arial", 10), format="%02.0f").pack(side=tk.LEFT, padx=2)
         
@@ -453,7 +793,7 @@ class ReminderApp:
         tk.Radiobutton(time_frame, text="PM", variable=self.ampm_var, value="PM", bg='white').pack(side=tk.LEFT, padx=5)
         
         row += 1
-        tk.Label(add_frame, text="Priority:", bg='white', font=("Arial", 10)).grid(row=row, column=0, sticky=tk.W, pady=5)
+        ttk.Label(add_frame, text="Priority:", style="App.TLabel").grid(row=row, column=0, sticky=tk.W, pady=5)
         self.reminder_priority = ttk.Combobox(add_frame, values=["normal", "urgent"], width=18, font=("Arial", 10))
         self.reminder_priority.set("normal")
         self.reminder_priority.grid(row=row, column=1, pady=5, sticky=tk.W)
@@ -517,7 +857,7 @@ class ReminderApp:
         tab = tk.Frame(self.notebook, bg='white')
         self.notebook.add(tab, text="⏰ Alarms")
         
-        tk.Label(tab, text="Alarms feature - Similar to reminders", font=("Arial", 12), bg='white').pack(pady=50)
+        ttk.Label(tab, text="Alarms feature - Similar to reminders", style="Large.App.TLabel").pack(pady=50)
     
     def create_settings_tab(self):
         """Settings tab with screen selection"""
@@ -528,36 +868,94 @@ class ReminderApp:
         screen_frame = tk.LabelFrame(tab, text="🖥️ Screen Selection for Alerts", padx=20, pady=20, bg='white', font=("Arial", 11, "bold"))
         screen_frame.pack(fill=tk.X, padx=10, pady=10)
         
-        tk.Label(
+        self.screen_selection_var = tk.StringVar(value=self.selected_screens)
+        
+        # Rebuilt in place when the screens are rescanned
+        self.screen_list_frame = tk.Frame(screen_frame, bg='white')
+        self.screen_list_frame.pack(fill=tk.X)
+        self.populate_screen_list()
+        
+        tk.Button(
             screen_frame,
-            text=f"Detected Screens: {len(self.screens)}",
+            text="🔄 Rescan Screens",
+            command=self.rescan_screens,
+            bg=COLORS['info'],
+            fg='white',
+            padx=15,
+            pady=5
+        ).pack(anchor=tk.W, pady=10)
+        
+        # Alert settings
+        alert_frame = tk.LabelFrame(tab, text="Alert Settings", padx=20, pady=20, bg='white', font=("Arial", 11, "bold"))
+        alert_frame.pack(fill=tk.X, padx=10, pady=10)
+        
+        self.fullscreen_var = tk.BooleanVar(value=self.fullscreen_mode)
+        tk.Checkbutton(
+            alert_frame,
+            text="Show alerts in FULLSCREEN mode",
+            variable=self.fullscreen_var,
             bg='white',
-            font=("Arial", 10, "bold"),
-            fg=COLORS['success']
+            font=("Arial", 10),
+            command=self.toggle_fullscreen_mode
+        ).pack(anchor=tk.W, pady=5)
+        
+        # Tone settings
+        tone_frame = tk.LabelFrame(tab, text="Alarm Tone", padx=20, pady=20, bg='white', font=("Arial", 11, "bold"))
+        tone_frame.pack(fill=tk.X, padx=10, pady=10)
+        
+        current = os.path.basename(self.custom_tone_path) if self.custom_tone_path else "Default beep"
+        self.tone_label = ttk.Label(tone_frame, text=f"Current: {current}", style="Tone.App.TLabel")
+        self.tone_label.pack(pady=5)
+        
+        tk.Button(
+            tone_frame,
+            text="📁 Select Custom Tone",
+            command=self.select_custom_tone,
+            bg=COLORS['primary'],
+            fg='white',
+            padx=15,
+            pady=5
+        ).pack(pady=5)
+        
+        tk.Button(
+            tone_frame,
+            text="🔊 Test Sound",
+            command=self.test_sound,
+            bg=COLORS['success'],
+            fg='white',
+            padx=15,
+            pady=5
+        ).pack(pady=5)
+    
+    def populate_screen_list(self):
+        """(Re)build the detected screens list and screen choice buttons"""
+        screen_frame = self.screen_list_frame
+        for child in screen_frame.winfo_children():
+            child.destroy()
+        
+        ttk.Label(
+            screen_frame,
+            text=f"Detected Screens: {len(self.screens)}",
+            style="Count.App.TLabel"
         ).pack(anchor=tk.W, pady=5)
         
         # List all screens
         for screen in self.screens:
             primary_text = " (Primary)" if screen['is_primary'] else ""
-            tk.Label(
+            ttk.Label(
                 screen_frame,
                 text=f"  • {screen['name']}: {screen['width']}x{screen['height']}{primary_text}",
-                bg='white',
-                font=("Arial", 9),
-                fg=COLORS['info']
+                style="Screen.App.TLabel"
             ).pack(anchor=tk.W, pady=2)
         
-        tk.Label(screen_frame, text="", bg='white').pack(pady=5)  # Spacer
+        ttk.Label(screen_frame, text="", style="App.TLabel").pack(pady=5)  # Spacer
         
-        tk.Label(
+        ttk.Label(
             screen_frame,
             text="Show alerts on:",
-            bg='white',
-            font=("Arial", 10, "bold")
+            style="Bold.App.TLabel"
         ).pack(anchor=tk.W, pady=5)
         
-        self.screen_selection_var = tk.StringVar(value=self.selected_screens)
-        
         # Radio buttons for screen selection
         tk.Radiobutton(
             screen_frame,
@@ -590,48 +988,15 @@ class ReminderApp:
                 font=("Arial", 10),
                 command=self.save_screen_selection
             ).pack(anchor=tk.W, pady=3)
-        
-        # Alert settings
-        alert_frame = tk.LabelFrame(tab, text="Alert Settings", padx=20, pady=20, bg='white', font=("Arial", 11, "bold"))
-        alert_frame.pack(fill=tk.X, padx=10, pady=10)
-        
-        self.fullscreen_var = tk.BooleanVar(value=self.fullscreen_mode)
-        tk.Checkbutton(
-            alert_frame,
-            text="Show alerts in FULLSCREEN mode",
-            variable=self.fullscreen_var,
-            bg='white',
-            font=("Arial", 10),
-            command=self.toggle_fullscreen_mode
-        ).pack(anchor=tk.W, pady=5)
-        
-        # Tone settings
-        tone_frame = tk.LabelFrame(tab, text="Alarm Tone", padx=20, pady=20, bg='white', font=("Arial", 11, "bold"))
-        tone_frame.pack(fill=tk.X, padx=10, pady=10)
-        
-        current = os.path.basename(self.custom_tone_path) if self.custom_tone_path else "Default beep"
-        self.tone_label = tk.Label(tone_frame, text=f"Current: {current}", bg='white', fg=COLORS['primary'], font=("Arial", 10))
-        self.tone_label.pack(pady=5)
-        
-        tk.Button(
-            tone_frame,
-            text="📁 Select Custom Tone",
-            command=self.select_custom_tone,
-            bg=COLORS['primary'],
-            fg='white',
-            padx=15,
-            pady=5
-        ).pack(pady=5)
-        
-        tk.Button(
-            tone_frame,
-            text="🔊 Test Sound",
-            command=self.test_sound,
-            bg=COLORS['success'],
-            fg='white',
-            padx=15,
-            pady=5
-        ).pack(pady=5)
+    
+    def rescan_screens(self):
+        """Drop the cached screen layout and detect screens again"""
+        try:
+            os.remove(SCREENS_CACHE_FILE)
+        except FileNotFoundError:
+            pass
+        # The list and alert windows are rebuilt when detection finishes
+        self.detect_screens(use_cache=False)
     
     def save_screen_selection(self):
         """Save screen selection preference"""
@@ -666,6 +1031,7 @@ class ReminderApp:
         if file_path:
             self.custom_tone_path = file_path
             self.save_settings()
+            self.preload_custom_tone()
             self.tone_label.config(text=f"Current: {os.path.basename(file_path)}")
             messagebox.showinfo("Success", "Custom tone set!")
     
@@ -676,7 +1042,7 @@ class ReminderApp:
     
     def record_voice_note(self):
         """Record voice note for reminder"""
-        if not VOICE_AVAILABLE:
+        if not VOICE_AVAILABLE or get_pyaudio() is None:
             messagebox.showerror("Error", "Voice recording not available!\n\nInstall: pip install pyaudio")
             return
         
@@ -687,11 +1053,7 @@ class ReminderApp:
         dialog.transient(self.root)
         dialog.grab_set()
         
-        # Center
-        dialog.update_idletasks()
-        x = (self.root.winfo_screenwidth() - 400) // 2
-        y = (self.root.winfo_screenheight() - 250) // 2
-        dialog.geometry(f"+{x}+{y}")
+        dialog.geometry(self._center_position(400, 250))
         
         tk.Label(dialog, text="🎤 Voice Note Recorder", font=("Arial", 14, "bold"), bg='white').pack(pady=20)
         
@@ -749,105 +1111,123 @@ class ReminderApp:
             try:
                 idx = int(self.selected_screens)
                 return [self.screens[idx]]
-            except:
+            except (ValueError, IndexError):
                 return [self.get_primary_screen()]
     
+    def build_alert_pool(self):
+        """(Re)build the hidden alert window for every detected screen"""
+        # An alert still on screen moves to the new windows instead of being dismissed
+        current = self._alert_info
+        for alert in self._alert_pool.values():
+            self._stop_flashing(alert)
+            alert.destroy()
+        self._shown_alerts = []
+        self._alert_info = None
+        self._alert_pool = {screen['index']: self._build_alert_toplevel() for screen in self.screens}
+        
+        if current is not None:
+            self.show_fullscreen_alert(*current)
+    
+    def _build_alert_toplevel(self):
+        """Create a withdrawn alert window; its text is filled in when an alert fires"""
+        alert = tk.Toplevel(self.root)
+        alert.withdraw()
+        alert.configure(bg=COLORS['alarm_red'])
+        alert.protocol("WM_DELETE_WINDOW", self.close_alert)
+        
+        # Container
+        container = tk.Frame(alert, bg=COLORS['alarm_red'])
+        container.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
+        
+        # Icon
+        tk.Label(container, text="🚨", font=("Arial", 120), bg=COLORS['alarm_red'], fg='white').pack(pady=20)
+        
+        # Title
+        alert.title_label = tk.Label(container, font=("Arial", 36, "bold"), bg=COLORS['alarm_red'], fg='white', wraplength=1000)
+        alert.title_label.pack(pady=15)
+        
+        # Message
+        alert.message_label = tk.Label(container, font=("Arial", 24), bg=COLORS['alarm_red'], fg='white', wraplength=1000)
+        alert.message_label.pack(pady=15)
+        
+        # Time
+        alert.time_label = tk.Label(container, font=("Arial", 20), bg=COLORS['alarm_red'], fg='white')
+        alert.time_label.pack(pady=10)
+        
+        # Snooze section
+        tk.Label(container, text="⏰ Snooze:", font=("Arial", 18, "bold"), bg=COLORS['alarm_red'], fg='white').pack(pady=10)
+        
+        snooze_frame = tk.Frame(container, bg=COLORS['alarm_red'])
+        snooze_frame.pack(pady=10)
+        
+        for minutes in [5, 10, 15, 30]:
+            tk.Button(
+                snooze_frame,
+                text=f"{minutes} min",
+                command=functools.partial(self.snooze_alert, minutes),
+                bg='white',
+                fg=COLORS['alarm_red'],
+                font=("Arial", 16, "bold"),
+                padx=20,
+                pady=10
+            ).pack(side=tk.LEFT, padx=5)
+        
+        # Dismiss
+        tk.Button(
+            container,
+            text="✓ DISMISS",
+            command=self.close_alert,
+            bg='white',
+            fg=COLORS['alarm_red'],
+            font=("Arial", 24, "bold"),
+            padx=40,
+            pady=15
+        ).pack(pady=20)
+        
+        alert.container = container
+        alert.flash_job = None
+        alert.flash_colors = None
+        return alert
+    
     def show_fullscreen_alert(self, title, message, item_id=None, custom_voice=None):
         """Show alert on selected screen(s)"""
         
+        # The alert windows are shared, so a second alert waits for the first to close
+        if self._alert_info is not None:
+            self._alert_queue.append((title, message, item_id, custom_voice))
+            return
+        
         self.stop_alarm_sound()
         
-        screens_to_use = self.get_screens_to_show()
-        alert_windows = []
+        self._alert_info = (title, message, item_id, custom_voice)
+        now_str = datetime.now().strftime("%I:%M:%S %p")
         
-        # Create alert on each selected screen
-        for screen in screens_to_use:
-            alert = tk.Toplevel()
+        # Show the alert on each selected screen
+        for screen in self.get_screens_to_show():
+            alert = self._alert_pool[screen['index']]
             
             if self.fullscreen_mode:
                 # TRUE FULLSCREEN MODE
                 alert.attributes('-fullscreen', True)
                 alert.attributes('-topmost', True)
-                alert.geometry(f"{screen['width']}x{screen['height']}+{screen['x']}+{screen['y']}")
+                alert.geometry(screen['fs_geom'])
             else:
                 # LARGE CENTERED WINDOW MODE
+                alert.attributes('-fullscreen', False)
                 alert.attributes('-topmost', True)
-                alert_width = int(screen['width'] * 0.8)
-                alert_height = int(screen['height'] * 0.8)
-                x = screen['x'] + (screen['width'] - alert_width) // 2
-                y = screen['y'] + (screen['height'] - alert_height) // 2
-                alert.geometry(f"{alert_width}x{alert_height}+{x}+{y}")
-            
-            alert.configure(bg=COLORS['alarm_red'])
-            
-            # Container
-            container = tk.Frame(alert, bg=COLORS['alarm_red'])
-            container.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
-            
-            # Icon
-            tk.Label(container, text="🚨", font=("Arial", 120), bg=COLORS['alarm_red'], fg='white').pack(pady=20)
-            
-            # Title
-            tk.Label(container, text=title, font=("Arial", 36, "bold"), bg=COLORS['alarm_red'], fg='white', wraplength=1000).pack(pady=15)
-            
-            # Message
-            tk.Label(container, text=message, font=("Arial", 24), bg=COLORS['alarm_red'], fg='white', wraplength=1000).pack(pady=15)
+                alert.geometry(screen['win_geom_80'])
             
-            # Time
-            tk.Label(container, text=datetime.now().strftime("%I:%M:%S %p"), font=("Arial", 20), bg=COLORS['alarm_red'], fg='white').pack(pady=10)
+            alert.title_label.config(text=title)
+            alert.message_label.config(text=message)
+            alert.time_label.config(text=now_str)
             
-            # Snooze section
-            tk.Label(container, text="⏰ Snooze:", font=("Arial", 18, "bold"), bg=COLORS['alarm_red'], fg='white').pack(pady=10)
+            alert.deiconify()
+            alert.lift()
+            self._shown_alerts.append(alert)
             
-            snooze_frame = tk.Frame(container, bg=COLORS['alarm_red'])
-            snooze_frame.pack(pady=10)
-            
-            def snooze_action(minutes):
-                self.snooze_item(item_id, minutes, title, message, custom_voice)
-                self.stop_alarm_sound()
-                for win in alert_windows:
-                    try:
-                        win.destroy()
-                    except:
-                        pass
-            
-            for minutes in [5, 10, 15, 30]:
-                tk.Button(
-                    snooze_frame,
-                    text=f"{minutes} min",
-                    command=lambda m=minutes: snooze_action(m),
-                    bg='white',
-                    fg=COLORS['alarm_red'],
-                    font=("Arial", 16, "bold"),
-                    padx=20,
-                    pady=10
-                ).pack(side=tk.LEFT, padx=5)
-            
-            # Dismiss
-            tk.Button(
-                container,
-                text="✓ DISMISS",
-                command=lambda: [self.stop_alarm_sound()] + [win.destroy() for win in alert_windows],
-                bg='white',
-                fg=COLORS['alarm_red'],
-                font=("Arial", 24, "bold"),
-                padx=40,
-                pady=15
-            ).pack(pady=20)
-            
-            alert_windows.append(alert)
-            
-            # Flash effect
-            def flash(window, color_index=0):
-                colors = [COLORS['alarm_red'], COLORS['alarm_blue']]
-                try:
-                    window.configure(bg=colors[color_index])
-                    container.configure(bg=colors[color_index])
-                    window.after(500, lambda: flash(window, 1 - color_index))
-                except:
-                    pass
-            
-            flash(alert)
+            # Flash effect, starting from red each time
+            alert.flash_colors = itertools.cycle((COLORS['alarm_red'], COLORS['alarm_blue']))
+            self.flash_alert(alert)
         
         # Play sound
         self.play_alarm_sound(custom_voice)
@@ -855,12 +1235,48 @@ class ReminderApp:
         if not hasattr(self, 'root') or self.root.state() == 'withdrawn':
             self.show_window()
     
+    def flash_alert(self, alert):
+        """Alternate the alert background until the alert is closed"""
+        if not alert.winfo_exists():
+            return
+        color = next(alert.flash_colors)
+        alert.configure(bg=color)
+        alert.container.configure(bg=color)
+        alert.flash_job = alert.after(500, self.flash_alert, alert)
+    
+    def _stop_flashing(self, alert):
+        """Cancel the pending flash callback of an alert window"""
+        if alert.flash_job:
+            alert.after_cancel(alert.flash_job)
+            alert.flash_job = None
+    
+    def close_alert(self):
+        """Stop the sound, hide the alert windows and show the next queued alert"""
+        if self._alert_info is None:
+            return
+        
+        self.stop_alarm_sound()
+        for alert in self._shown_alerts:
+            self._stop_flashing(alert)
+            alert.withdraw()
+        self._shown_alerts = []
+        self._alert_info = None
+        
+        if self._alert_queue:
+            self.show_fullscreen_alert(*self._alert_queue.popleft())
+    
+    def snooze_alert(self, minutes):
+        """Snooze the visible alert"""
+        title, message, item_id, custom_voice = self._alert_info
+        self.snooze_item(item_id, minutes, title, message, custom_voice)
+        self.close_alert()
+    
     def snooze_item(self, item_id, minutes, title, message, custom_voice):
         """Snooze an alert"""
         trigger_time = datetime.now() + timedelta(minutes=minutes)
         
         snoozed = {
-            'id': int(time.time() * 1000),
+            'id': next(self._id_counter),
             'original_id': item_id,
             'title': title,
             'message': message,
@@ -869,19 +1285,10 @@ class ReminderApp:
             'active': True
         }
         
-        self.snoozed_items.append(snoozed)
+        self.snoozed_items[snoozed['id']] = snoozed
+        self.schedule_item(trigger_time.replace(second=0, microsecond=0).timestamp(), 'snooze', snoozed['id'])
         messagebox.showinfo("Snoozed", f"Will alert again at {trigger_time.strftime('%I:%M %p')}")
     
-    def check_snoozed(self):
-        """Check snoozed items"""
-        now = datetime.now()
-        current = now.strftime("%Y-%m-%d %H:%M")
-        
-        for item in self.snoozed_items:
-            if item['active'] and item['trigger_time'] == current:
-                self.show_fullscreen_alert(item['title'], item['message'], item['original_id'], item.get('custom_voice'))
-                item['active'] = False
-    
     def edit_reminder(self):
         """Edit selected reminder"""
         selection = self.reminders_listbox.curselection()
@@ -889,18 +1296,19 @@ class ReminderApp:
             messagebox.showwarning("Warning", "Select a reminder to edit!")
             return
         
-        item_text = self.reminders_listbox.get(selection[0])
-        try:
-            reminder_id = int(item_text.split("ID:")[1].strip())
-            reminder = next((r for r in self.reminders if r['id'] == reminder_id), None)
-            
-            if reminder:
-                self.show_edit_dialog(reminder)
-        except:
+        reminder = self.reminders_by_id.get(self._listbox_ids[selection[0]])
+        if reminder:
+            self.show_edit_dialog(reminder)
+        else:
             messagebox.showerror("Error", "Could not edit")
     
     def show_edit_dialog(self, reminder):
         """Show edit dialog with time and voice"""
+        DateEntry = get_date_entry()
+        if DateEntry is None:
+            messagebox.showerror("Error", "Date picker not available!\n\nInstall: pip install tkcalendar")
+            return
+        
         dialog = tk.Toplevel(self.root)
         dialog.title("✏️ Edit Reminder")
         dialog.geometry("550x550")
@@ -908,66 +1316,29 @@ class ReminderApp:
         dialog.transient(self.root)
         dialog.grab_set()
         
-        # Center
-        dialog.update_idletasks()
-        x = (self.root.winfo_screenwidth() - 550) // 2
-        y = (self.root.winfo_screenheight() - 550) // 2
-        dialog.geometry(f"+{x}+{y}")
+        dialog.geometry(self._center_position(550, 550))
         
         tk.Label(dialog, text="✏️ Edit Reminder", font=("Arial", 16, "bold"), bg='white', fg=COLORS['primary']).pack(pady=15)
         
         form = tk.Frame(dialog, bg='white')
         form.pack(padx=20, pady=10, fill=tk.BOTH, expand=True)
         
-        row = 0
-        
-        # Title
-        tk.Label(form, text="Title:", bg='white', font=("Arial", 10, "bold")).grid(row=row, column=0, sticky=tk.W, pady=8)
+        # Title and description
         title_entry = tk.Entry(form, width=35, font=("Arial", 10))
         title_entry.insert(0, reminder['title'])
-        title_entry.grid(row=row, column=1, pady=8, sticky=tk.W)
-        
-        row += 1
-        
-        # Description
-        tk.Label(form, text="Description:", bg='white', font=("Arial", 10, "bold")).grid(row=row, column=0, sticky=tk.W, pady=8)
         desc_entry = tk.Entry(form, width=35, font=("Arial", 10))
         desc_entry.insert(0, reminder['description'])
-        desc_entry.grid(row=row, column=1, pady=8, sticky=tk.W)
-        
-        row += 1
         
-        # Date
-        tk.Label(form, text="Date:", bg='white', font=("Arial", 10, "bold")).grid(row=row, column=0, sticky=tk.W, pady=8)
+        # Date and time; _trigger_ts is None when the stored date or time doesn't parse
         date_entry = DateEntry(form, width=25, font=("Arial", 10))
-        try:
-            date_entry.set_date(datetime.strptime(reminder['date'], "%Y-%m-%d").date())
-        except:
-            pass
-        date_entry.grid(row=row, column=1, pady=8, sticky=tk.W)
-        
-        row += 1
-        
-        # Time
-        tk.Label(form, text="Time:", bg='white', font=("Arial", 10, "bold")).grid(row=row, column=0, sticky=tk.W, pady=8)
-        
-        # Parse existing time
-        try:
-            h24, m = reminder['time'].split(':')
-            h24 = int(h24)
-            minute = int(m)
-            ampm = "AM" if h24 < 12 else "PM"
-            hour = h24 if h24 <= 12 else h24 - 12
-            if hour == 0:
-                hour = 12
-        except:
-            hour = 12
-            minute = 0
-            ampm = "AM"
+        if reminder['_trigger_ts'] is not None:
+            date_entry.set_date(datetime.fromtimestamp(reminder['_trigger_ts']).date())
+            hour, minute, ampm = self._split_12h(reminder['time'])
+        else:
+            hour, minute, ampm = 12, 0, "AM"
         
         # Time picker
         time_frame = tk.Frame(form, bg='white')
-        time_frame.grid(row=row, column=1, pady=8, sticky=tk.W)
         
         edit_hour_var = tk.IntVar(value=hour)
         tk.Spinbox(time_frame, from_=1, to=12, textvariable=edit_hour_var, width=3, font=("Arial", 10)).pack(side=tk.LEFT, padx=2)
@@ -979,25 +1350,14 @@ class ReminderApp:
         tk.Radiobutton(time_frame, text="AM", variable=edit_ampm_var, value="AM", bg='white', font=("Arial", 9)).pack(side=tk.LEFT, padx=5)
         tk.Radiobutton(time_frame, text="PM", variable=edit_ampm_var, value="PM", bg='white', font=("Arial", 9)).pack(side=tk.LEFT, padx=5)
         
-        row += 1
-        
         # Priority
-        tk.Label(form, text="Priority:", bg='white', font=("Arial", 10, "bold")).grid(row=row, column=0, sticky=tk.W, pady=8)
         priority_combo = ttk.Combobox(form, values=["normal", "urgent"], width=23, font=("Arial", 10))
         priority_combo.set(reminder.get('priority', 'normal'))
-        priority_combo.grid(row=row, column=1, pady=8, sticky=tk.W)
-        
-        row += 1
         
         # Voice note status
         current_voice = reminder.get('voice_note', '')
         voice_filename = os.path.basename(current_voice) if current_voice else "None"
-        
-        tk.Label(form, text="Voice Note:", bg='white', font=("Arial", 10, "bold")).grid(row=row, column=0, sticky=tk.W, pady=8)
         voice_status_label = tk.Label(form, text=f"Current: {voice_filename}", bg='white', fg=COLORS['info'], font=("Arial", 9))
-        voice_status_label.grid(row=row, column=1, pady=8, sticky=tk.W)
-        
-        row += 1
         
         new_voice_note = {'path': None}
         
@@ -1005,8 +1365,7 @@ class ReminderApp:
             # Recording logic here (same as before)
             pass
         
-        # Record button
-        tk.Button(
+        record_button = tk.Button(
             form,
             text="🎤 Record New Voice",
             command=record_new_voice,
@@ -1015,23 +1374,48 @@ class ReminderApp:
             font=("Arial", 9, "bold"),
             padx=10,
             pady=5
-        ).grid(row=row, column=1, pady=8, sticky=tk.W)
+        )
         
-        row += 1
+        # One labelled row per field
+        fields = (
+            ("Title:", title_entry),
+            ("Description:", desc_entry),
+            ("Date:", date_entry),
+            ("Time:", time_frame),
+            ("Priority:", priority_combo),
+            ("Voice Note:", voice_status_label),
+            (None, record_button),
+        )
+        for row, (label, widget) in enumerate(fields):
+            if label:
+                ttk.Label(form, text=label, style="Bold.App.TLabel").grid(row=row, column=0, sticky=tk.W, pady=8)
+            widget.grid(row=row, column=1, pady=8, sticky=tk.W)
         
         # Save button
         def save():
+            try:
+                time_str = self.get_24hour_time(edit_hour_var.get(), edit_minute_var.get(), edit_ampm_var.get())
+            except (tk.TclError, ValueError):
+                messagebox.showerror("Error", "Enter a valid time!", parent=dialog)
+                return
+            
             reminder['title'] = title_entry.get().strip()
             reminder['description'] = desc_entry.get().strip()
             reminder['date'] = date_entry.get_date().strftime("%Y-%m-%d")
-            reminder['time'] = self.get_24hour_time(edit_hour_var.get(), edit_minute_var.get(), edit_ampm_var.get())
+            reminder['time'] = time_str
             reminder['priority'] = priority_combo.get()
             
             if new_voice_note['path']:
                 reminder['voice_note'] = new_voice_note['path']
             
+            self._recompute_derived(reminder)
+            
+            # The old heap entry no longer matches the reminder's time, so it is skipped
+            if reminder['active']:
+                self.schedule_item(reminder['_trigger_ts'], 'reminder', reminder['id'])
+            
             self.save_data()
-            self.refresh_reminders_list()
+            self.request_refresh()
             messagebox.showinfo("Success", "Reminder updated!")
             dialog.destroy()
         
@@ -1064,12 +1448,24 @@ class ReminderApp:
     def get_24hour_time(self, hour, minute, ampm):
         hour = int(hour)
         minute = int(minute)
+        # The spinboxes accept typed text, so the range isn't guaranteed
+        if not (1 <= hour <= 12 and 0 <= minute <= 59):
+            raise ValueError(f"invalid time {hour}:{minute:02d}")
         if ampm == "AM" and hour == 12:
             hour = 0
         elif ampm == "PM" and hour != 12:
             hour += 12
         return f"{hour:02d}:{minute:02d}"
     
+    def _create_add_date_entry(self, parent, row):
+        """Put the date picker into the add-reminder form"""
+        DateEntry = get_date_entry()
+        if DateEntry is None:
+            ttk.Label(parent, text="Unavailable (pip install tkcalendar)", style="App.TLabel").grid(row=row, column=1, pady=5, sticky=tk.W)
+            return
+        self.reminder_date = DateEntry(parent, width=20, font=("Arial", 10))
+        self.reminder_date.grid(row=row, column=1, pady=5, sticky=tk.W)
+    
     def add_reminder_gui(self):
         """Add reminder"""
         title = self.reminder_title.get().strip()
@@ -1077,12 +1473,23 @@ class ReminderApp:
             messagebox.showerror("Error", "Enter a title!")
             return
         
+        if self.reminder_date is None:
+            messagebox.showerror("Error", "Date picker not available!\n\nInstall: pip install tkcalendar")
+            return
+        
+        # Validated here so stored times always parse
+        try:
+            time_str = self.get_24hour_time(self.hour_var.get(), self.minute_var.get(), self.ampm_var.get())
+        except (tk.TclError, ValueError):
+            messagebox.showerror("Error", "Enter a valid time!")
+            return
+        
         reminder = {
-            'id': int(time.time() * 1000),
+            'id': next(self._id_counter),
             'title': title,
             'description': self.reminder_desc.get().strip(),
             'date': self.reminder_date.get_date().strftime("%Y-%m-%d"),
-            'time': self.get_24hour_time(self.hour_var.get(), self.minute_var.get(), self.ampm_var.get()),
+            'time': time_str,
             'priority': self.reminder_priority.get(),
             'active': True
         }
@@ -1091,36 +1498,59 @@ class ReminderApp:
             reminder['voice_note'] = self.pending_voice_note
             self.pending_voice_note = None
         
-        self.reminders.append(reminder)
+        self._recompute_derived(reminder)
+        self.reminders_by_id[reminder['id']] = reminder
+        self.schedule_item(reminder['_trigger_ts'], 'reminder', reminder['id'])
         self.save_data()
         
         self.reminder_title.delete(0, tk.END)
         self.reminder_desc.delete(0, tk.END)
         
-        self.refresh_reminders_list()
+        self.request_refresh()
         messagebox.showinfo("Success", "Reminder added!")
     
+    def format_reminder(self, r):
+        """Listbox text for a reminder"""
+        priority = "🔴" if r['priority'] == 'urgent' else "🟢"
+        voice = "🎤" if r.get('voice_note') else ""
+        return f"{priority} {voice} {r['title']} | {r['date']} {r['_time_display']} | ID:{r['id']}"
+    
+    def request_refresh(self):
+        """Refresh the list once Tk is idle, so a burst of changes rebuilds it once"""
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.root.after_idle(self._do_refresh)
+    
+    def _do_refresh(self):
+        self._refresh_pending = False
+        self.refresh_reminders_list()
+    
     def refresh_reminders_list(self):
         """Refresh list"""
         if hasattr(self, 'reminders_listbox'):
-            self.reminders_listbox.delete(0, tk.END)
-            for r in self.reminders:
-                if r['active']:
-                    priority = "🔴" if r['priority'] == 'urgent' else "🟢"
-                    voice = "🎤" if r.get('voice_note') else ""
-                    try:
-                        h24, m = r['time'].split(':')
-                        h24 = int(h24)
-                        ampm = "AM" if h24 < 12 else "PM"
-                        h12 = h24 if h24 <= 12 else h24 - 12
-                        if h12 == 0:
-                            h12 = 12
-                        time_display = f"{h12}:{m} {ampm}"
-                    except:
-                        time_display = r['time']
-                    
-                    text = f"{priority} {voice} {r['title']} | {r['date']} {time_display} | ID:{r['id']}"
-                    self.reminders_listbox.insert(tk.END, text)
+            active = [r for r in self.reminders_by_id.values() if r['active']]
+            self._listbox_ids = [r['id'] for r in active]
+            items = tuple(self.format_reminder(r) for r in active)
+            old = self._rendered_rows
+            # Firing or saving often leaves the visible rows as they were
+            if items == old:
+                return
+            self._rendered_rows = items
+            
+            # Keep the rows that match at both ends and replace only the span between them
+            lo = 0
+            while lo < min(len(old), len(items)) and old[lo] == items[lo]:
+                lo += 1
+            old_hi, new_hi = len(old), len(items)
+            while old_hi > lo and new_hi > lo and old[old_hi - 1] == items[new_hi - 1]:
+                old_hi -= 1
+                new_hi -= 1
+            
+            if old_hi > lo:
+                self.reminders_listbox.delete(lo, old_hi - 1)
+            # One Tcl call for all new rows
+            if new_hi > lo:
+                self.reminders_listbox.insert(lo, *items[lo:new_hi])
     
     def delete_reminder(self):
         """Delete reminder"""
@@ -1129,37 +1559,100 @@ class ReminderApp:
             messagebox.showwarning("Warning", "Select a reminder!")
             return
         
-        item_text = self.reminders_listbox.get(selection[0])
-        try:
-            reminder_id = int(item_text.split("ID:")[1].strip())
-            self.reminders = [r for r in self.reminders if r['id'] != reminder_id]
+        if self.reminders_by_id.pop(self._listbox_ids[selection[0]], None):
+            self._reschedule()
             self.save_data()
-            self.refresh_reminders_list()
+            self.request_refresh()
             messagebox.showinfo("Success", "Deleted!")
-        except:
-            pass
     
-    def check_reminders(self):
-        """Check reminders"""
-        now = datetime.now()
-        current_date = now.strftime("%Y-%m-%d")
-        current_time = now.strftime("%H:%M")
+    def get_trigger_epoch(self, reminder):
+        """Epoch seconds of a reminder's date and 24-hour time"""
+        return datetime.strptime(f"{reminder['date']} {reminder['time']}", "%Y-%m-%d %H:%M").timestamp()
+    
+    def _recompute_derived(self, reminder):
+        """Cache the trigger time and display time; call whenever date or time changes.
+        Underscore keys are runtime-only and never saved."""
+        try:
+            reminder['_trigger_ts'] = self.get_trigger_epoch(reminder)
+        except (KeyError, ValueError):
+            reminder['_trigger_ts'] = None
+            reminder['_time_display'] = reminder.get('time', '')
+            return
+        reminder['_time_display'] = self._fmt_12h(reminder['time'])
+    
+    @staticmethod
+    def _split_12h(hhmm):
+        """Split a 24-hour 'HH:MM' into (hour, minute, 'AM'/'PM'), e.g. '13:05' -> (1, 5, 'PM')"""
+        h24, minute = map(int, hhmm.split(':'))
+        return h24 % 12 or 12, minute, "AM" if h24 < 12 else "PM"
+    
+    @staticmethod
+    def _fmt_12h(hhmm):
+        """Format a 24-hour 'HH:MM' for display, e.g. '13:05' -> '1:05 PM'"""
+        hour, minute, ampm = ReminderApp._split_12h(hhmm)
+        return f"{hour}:{minute:02d} {ampm}"
+    
+    def schedule_item(self, trigger_epoch, kind, item_id):
+        """Queue a reminder or snoozed alert for its trigger time"""
+        # Same rule as start_scheduler, so a reminder saved in the past doesn't alert at once
+        if kind == 'reminder' and trigger_epoch < time.time() - MISSED_GRACE_SECONDS:
+            return
+        heapq.heappush(self._due_heap, (trigger_epoch, kind, item_id))
+        self._reschedule()
+    
+    def _lookup_due(self, entry):
+        """Return the item behind a heap entry, or None if it was deleted or edited since"""
+        trigger_epoch, kind, item_id = entry
+        if kind == 'snooze':
+            return self.snoozed_items.get(item_id)
+        
+        reminder = self.reminders_by_id.get(item_id)
+        if reminder and reminder['active'] and reminder['_trigger_ts'] == trigger_epoch:
+            return reminder
+        return None
+    
+    def _reschedule(self):
+        """Arm a single timer for the next due item"""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        
+        # Don't wake up for entries left behind by deletes and edits
+        while self._due_heap and self._lookup_due(self._due_heap[0]) is None:
+            heapq.heappop(self._due_heap)
+        
+        if self._due_heap:
+            delay_ms = int((self._due_heap[0][0] - time.time()) * 1000)
+            self._after_id = self.root.after(min(max(delay_ms, 0), MAX_TIMER_MS), self._fire_due)
+    
+    def _fire_due(self):
+        """Fire every queued item whose trigger time has passed"""
+        self._after_id = None
+        now = time.time()
         
-        for reminder in self.reminders:
-            if reminder['active'] and reminder['date'] == current_date and reminder['time'] == current_time:
+        try:
+            while self._due_heap and self._due_heap[0][0] <= now:
+                entry = heapq.heappop(self._due_heap)
+                item = self._lookup_due(entry)
+                if item is None:
+                    continue
+                
+                if entry[1] == 'snooze':
+                    del self.snoozed_items[item['id']]
+                    self.show_fullscreen_alert(item['title'], item['message'], item['original_id'], item.get('custom_voice'))
+                    continue
+                
                 self.show_fullscreen_alert(
-                    f"REMINDER: {reminder['title']}",
-                    reminder['description'],
-                    reminder['id'],
-                    reminder.get('voice_note')
+                    f"REMINDER: {item['title']}",
+                    item['description'],
+                    item['id'],
+                    item.get('voice_note')
                 )
-                reminder['active'] = False
+                item['active'] = False
                 self.save_data()
-                if hasattr(self, 'root'):
-                    try:
-                        self.root.after(100, self.refresh_reminders_list)
-                    except:
-                        pass
+                self.request_refresh()
+        finally:
+            self._reschedule()
     
     def load_data(self):
         """Load data"""
@@ -1167,29 +1660,73 @@ class ReminderApp:
             try:
                 with open(DATA_FILE, 'r') as f:
                     data = json.load(f)
-                    self.reminders = data.get('reminders', [])
+                    self.reminders_by_id = {r['id']: r for r in data.get('reminders', [])}
+                    for r in self.reminders_by_id.values():
+                        self._recompute_derived(r)
                     self.alarms = data.get('alarms', [])
-            except:
-                pass
+            except (OSError, ValueError) as e:
+                print(f"Data load error: {e}")
     
     def save_data(self):
-        """Save data"""
-        with open(DATA_FILE, 'w') as f:
-            json.dump({'reminders': self.reminders, 'alarms': self.alarms}, f, indent=2)
+        """Mark data as changed; a burst of changes is written once"""
+        if not self._data_dirty:
+            self._data_dirty = True
+            self.root.after(DATA_SAVE_DELAY_MS, self.flush_data)
+    
+    def flush_data(self):
+        """Hand a snapshot of the data to the writer thread"""
+        if not self._data_dirty:
+            return
+        self._data_dirty = False
+        
+        # Snapshot on this thread; underscore keys are runtime caches rebuilt on load
+        state = {
+            'reminders': [{k: v for k, v in r.items() if not k.startswith('_')}
+                          for r in self.reminders_by_id.values()],
+            'alarms': [dict(a) for a in self.alarms]
+        }
+        self._write_q.put(state)
     
-    def monitor_loop(self):
-        """Monitor loop"""
-        while self.running:
+    def _writer_loop(self):
+        """Write data snapshots to disk off the Tk thread"""
+        while True:
+            batch = [self._write_q.get()]
+            while True:
+                try:
+                    batch.append(self._write_q.get_nowait())
+                except queue.Empty:
+                    break
+            
+            # Only the newest snapshot in a burst is written
             try:
-                self.check_reminders()
-                self.check_snoozed()
-            except:
-                pass
-            time.sleep(30)
+                payload = json_dumps(batch[-1])
+                # Write a temp file and rename it so a crash never leaves a truncated file
+                tmp = DATA_FILE + '.tmp'
+                with open(tmp, 'wb') as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp, DATA_FILE)
+            except (OSError, TypeError, ValueError) as e:
+                print(f"Save error: {e}")
+            finally:
+                # quit_app joins the queue, so every item must be marked done whatever happened
+                for _ in batch:
+                    self._write_q.task_done()
     
-    def start_monitor_thread(self):
-        """Start monitor"""
-        threading.Thread(target=self.monitor_loop, daemon=False).start()
+    def start_scheduler(self):
+        """Queue all upcoming reminders and arm the timer"""
+        cutoff = time.time() - MISSED_GRACE_SECONDS
+        for r in self.reminders_by_id.values():
+            trigger_epoch = r['_trigger_ts']
+            if not r['active'] or trigger_epoch is None:
+                continue
+            # Reminders missed while the app was closed are not replayed
+            if trigger_epoch >= cutoff:
+                self._due_heap.append((trigger_epoch, 'reminder', r['id']))
+        # One linear heapify instead of a push per reminder
+        heapq.heapify(self._due_heap)
+        self._reschedule()
     
     def on_closing(self):
         """Handle close"""
@@ -1203,11 +1740,8 @@ class ReminderApp:
         """Run app"""
         try:
             self.root.mainloop()
-        except:
+        except KeyboardInterrupt:
             pass
-        
-        while self.running:
-            time.sleep(1)
 
 if __name__ == "__main__":
     print("="*60)